@@ -156,22 +156,20 @@ def _handle_scan(
     Returns:
         Exit code: 0 (success), 1 (runtime error), 2 (validation error)
     """
-    from .version_scanner import format_nested_version_output, scan_vendor_packages_nested
+    from .version_scanner import iter_formatted_nested
 
     if target_path is None:
         print("Error: target_path is required for scan mode", file=sys.stderr)
         return 2
 
     try:
-        versions = scan_vendor_packages_nested(
+        # Write each package as the scan reaches it
+        lines = iter_formatted_nested(
             target_path=target_path,
             vendor_dir=vendor,
             version_tag=version_tag,
         )
-
-        # Format and print the output
-        output = format_nested_version_output(versions)
-        print(output)
+        sys.stdout.writelines(f"{line}\n" for line in lines)
 
         return 0
 
@@ -292,6 +292,32 @@ def _clean_phase(vendor_target_path: Path) -> int:
     return files_removed
 
 
+def _parse_extensions(extensions: str) -> set[str]:
+    """Parse a semicolon-separated extension list into a lowercase set."""
+    return {ext.strip().lower() for ext in extensions.split(";")}
+
+
+def _file_extension(file_path: Path) -> str:
+    """Return a file's extension normalized for matching: lowercase, without the leading dot.
+
+    The form _parse_extensions() produces, so the result can be looked up in an
+    extension set directly.
+    """
+    return file_path.suffix.lstrip(".").lower()
+
+
+def _should_copy(file_ext: str, ext_set: set[str]) -> bool:
+    """Check whether a file extension is selected for copying.
+
+    Matching is case-insensitive: file_ext comes from _file_extension() and
+    ext_set from _parse_extensions(), both lowercase without the leading dot.
+
+    Returns:
+        True if the file should be copied, False otherwise
+    """
+    return file_ext in ext_set
+
+
 def _sync_phase(
     source_package_path: Path,
     vendor_target_path: Path,
@@ -312,7 +338,7 @@ def _sync_phase(
     }
 
     # Parse extensions
-    ext_set = {ext.strip().lower() for ext in extensions.split(";")}
+    ext_set = _parse_extensions(extensions)
 
     try:
         # Create target directory
@@ -337,9 +363,9 @@ def _sync_phase(
                     result["directories_created"] += 1
 
                 elif source_item.is_file():
-                    # Check extension
-                    file_ext = source_item.suffix.lstrip(".").lower()
-                    if file_ext not in ext_set:
+                    # Check extension; the same normalized extension picks text or binary copy
+                    file_ext = _file_extension(source_item)
+                    if not _should_copy(file_ext, ext_set):
                         continue
 
                     # Create parent directories
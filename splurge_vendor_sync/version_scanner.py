@@ -1,16 +1,25 @@
-"""Scanner for extracting version information from vendored packages using AST.
+"""Scanner for extracting version information from vendored packages.
 
 This module provides utilities for scanning vendored package directories and extracting
-version information using Python's AST module. It searches for version tags in __init__.py
-and __main__.py files within each package. Supports recursive scanning of nested vendor
+version information with a precompiled regular expression, falling back to Python's AST
+module for assignments the expression cannot read. It searches for version tags in
+__init__.py and __main__.py files within each package. Supports recursive scanning of nested vendor
 directories to track transitive dependencies.
 """
 
 from __future__ import annotations
 
 import ast
+import functools
+import mmap
+import os
+import re
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TypedDict
+from typing import Any, ClassVar, TypedDict
 
 
 class VersionInfo(TypedDict):
@@ -38,51 +47,442 @@ class NestedVersionInfo(TypedDict, total=False):
     nested_packages: list[NestedVersionInfo]
 
 
-def extract_version_from_file(file_path: Path, version_tag: str = "__version__") -> str | None:
-    """Extract version value from a Python file using AST.
+class _FieldAccess:
+    """Read-only dict-style access to a record's fields, for code written against the TypedDicts.
 
-    Searches for an assignment statement matching the version_tag (e.g., __version__ = "1.0.0")
-    and returns the assigned string value.
+    Only the dataclass fields are keys: info["version"], info.get("version") and
+    "version" in info behave as on the dict, while any other name (methods,
+    dunders) is a missing key. Declares no slots of its own, so slotted
+    dataclasses that inherit it stay slotted.
+    """
+
+    __slots__ = ()
+    __dataclass_fields__: ClassVar[dict[str, Any]]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.__dataclass_fields__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the field named key, or default if there is no such field."""
+        return getattr(self, key) if key in self.__dataclass_fields__ else default
+
+
+@dataclass(slots=True)
+class PackageVersion(_FieldAccess):
+    """Version information for one package in a flat vendor scan.
+
+    A slotted record rather than a dict, like NestedPackageVersion. Supports
+    read-only dict-style access (info["version"], info.get("version")) for code
+    written against VersionInfo.
+
+    Attributes:
+        package_name: Name of the package
+        version: Version string if found, None otherwise
+    """
+
+    package_name: str
+    version: str | None
+
+
+@dataclass(slots=True)
+class NestedPackageVersion(_FieldAccess):
+    """Version information for one package in a nested vendor scan.
+
+    A slotted record rather than a dict, so large vendor trees cost less memory
+    per package. Supports read-only dict-style access (info["version"],
+    info.get("nested_packages")) for code written against NestedVersionInfo.
+
+    Attributes:
+        package_name: Name of the package
+        version: Version string if found, None otherwise
+        depth: Nesting depth (0 for top-level, 1+ for nested)
+        parent_package: Name of parent package containing this vendor
+        nested_packages: Packages in the nested vendor directory
+    """
+
+    package_name: str
+    version: str | None
+    depth: int = 0
+    parent_package: str | None = None
+    nested_packages: list[NestedPackageVersion] = field(default_factory=list)
+
+
+# Fields of compound statements (and except handlers) that hold nested statements
+_STATEMENT_BLOCKS = ("body", "orelse", "handlers", "finalbody")
+
+# Placeholder shown for packages without a version
+_UNKNOWN_VERSION = "?"
+
+# Indentation for each nesting level in nested output, built once
+_INDENT: tuple[str, ...] = tuple("  " * depth for depth in range(64))
+
+# Bytes read before falling back to the whole file; version assignments sit near the top
+_PREFIX_SIZE = 4096
+
+# Files larger than this are memory-mapped rather than read whole when the prefix has no match
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Files and directories modified less than this long ago are read without caching.
+# On filesystems with coarse timestamps (1-2 s on FAT, HFS+, ext3 and many network
+# mounts) a second same-size change within one tick keeps the same cache key, so a
+# result cached this early could go stale; git treats such entries as "racily clean"
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Default thread count for scan_vendor_packages(); the work is I/O-bound
+_DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Below this many packages a thread pool costs more than it saves
+_PARALLEL_MIN_PACKAGES = 4
+
+
+def _indent(depth: int) -> str:
+    """Return the indentation for a nesting depth, two spaces per level."""
+    return _INDENT[depth] if depth < len(_INDENT) else "  " * depth
+
+
+@functools.lru_cache(maxsize=32)
+def _pattern_for(version_tag: str, indented: bool = False) -> re.Pattern[bytes]:
+    """Return the compiled bytes pattern matching a quoted-string assignment to version_tag.
+
+    The pattern runs over raw file bytes with the tag in its UTF-8 form, so files
+    are never decoded as a whole; only a matched value is. By default the tag must
+    start the line, so an indented example in a docstring or an assignment inside
+    a function body never wins over the module-level assignment.
+
+    After the closing quote only whitespace and a comment may follow up to the end
+    of the line, so computed values such as `"1.0" + "-dev"` or `"1.0" if X else
+    "2.0"` do not match. A match never spans lines, so one found in the complete
+    lines of a prefix of a file is the same match a search of the whole file would
+    find.
+
+    The pattern runs in time linear in the input on the standard backtracking re
+    engine: with MULTILINE, ^ only lets a match start at a line start, and every
+    quantified run ([ \t]*, the value class, the comment) is followed by a literal
+    or line end it cannot consume, so a failed attempt backtracks at most once
+    through its own line. No third-party regex engine is needed to bound
+    adversarial files.
 
     Args:
-        file_path: Path to the Python file to scan
-        version_tag: The variable name to search for (default: '__version__')
+        version_tag: The variable name to match
+        indented: Also match assignments indented with spaces or tabs
 
     Returns:
-        The version string if found, None otherwise
+        Pattern whose second group captures the assigned, non-empty string value
+    """
+    return re.compile(
+        (rb"^[ \t]*" if indented else rb"^")
+        + re.escape(version_tag.encode("utf-8"))
+        + rb"[ \t]*=[ \t]*(['\"])([^'\"\r\n]+)\1[ \t]*(?:#[^\r\n]*)?\r?$",
+        re.MULTILINE,
+    )
+
+
+def _search(pattern: re.Pattern[bytes], needle: bytes, data: bytes | mmap.mmap, endpos: int) -> str | None:
+    """Search raw file bytes for a version assignment and decode its value.
+
+    Data that does not contain the tag's bytes at all is rejected with a substring
+    search, skipping the regex search. find() rather than the in operator, which
+    an mmap only supports for single bytes.
+
+    Args:
+        pattern: Compiled version-assignment pattern
+        needle: UTF-8 bytes of the version tag
+        data: Raw file contents, or a read-only memory map of them
+        endpos: Where the searched data ends; the end of the last complete line
+            when data is a prefix of the file, so a line cut short by the prefix
+            cannot match
+
+    Returns:
+        The assigned version string, or None if there is no match
 
     Raises:
-        ValueError: If file cannot be parsed as valid Python
+        UnicodeDecodeError: If the matched value is not valid UTF-8
     """
-    try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
-    except Exception:
+    if data.find(needle) == -1:
         return None
-
-    try:
-        tree = ast.parse(content)
-    except SyntaxError:
+    match = pattern.search(data, 0, endpos)
+    if match is None:
         return None
+    return match.group(2).decode("utf-8")
+
+
+def _parse_version(data: bytes, version_tag: str) -> str | None:
+    """Extract the version assigned to version_tag by parsing the file as Python.
+
+    The fallback for assignments the pattern cannot read: chained targets
+    (__version__ = version = "1.0"), parenthesized or prefixed literals
+    (("1.0"), u"1.0"), values containing the other quote character, and files
+    with CR-only line endings.
+
+    Only statements are visited, breadth-first: every module-level statement is
+    checked before any nested one, and the walk descends only into the statement
+    blocks (body, orelse, handlers, finalbody) of compound statements, never into
+    expressions, unlike ast.walk().
+
+    Args:
+        data: Raw contents of the whole file
+        version_tag: The variable name to search for
 
-    # Walk through the AST looking for assignments
-    for node in ast.walk(tree):
+    Returns:
+        The first non-empty string constant assigned to version_tag, or None if
+        there is none
+
+    Raises:
+        SyntaxError: If the file is not valid Python
+        ValueError: If the file contains null bytes
+        RecursionError: If the file nests too deeply to parse
+    """
+    # A for loop over a list also visits items appended during the loop, which
+    # makes the list a breadth-first queue
+    queue: list[ast.AST] = list(ast.parse(data).body)
+    for node in queue:
         if isinstance(node, ast.Assign):
-            # Check if this is an assignment to our target variable
-            for target in node.targets:
-                if isinstance(target, ast.Name) and target.id == version_tag:
-                    # Extract the value if it's a string constant
-                    if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
-                        return node.value.value
+            if (
+                isinstance(node.value, ast.Constant)
+                and isinstance(node.value.value, str)
+                and node.value.value
+                and any(isinstance(target, ast.Name) and target.id == version_tag for target in node.targets)
+            ):
+                return node.value.value
+            continue
+        for block in _STATEMENT_BLOCKS:
+            queue.extend(getattr(node, block, ()))
 
     return None
 
 
+@functools.lru_cache(maxsize=4096)
+def _read_version(path: str, mtime_ns: int, size: int, version_tag: str) -> str | None:
+    """Read path and extract the version assigned to version_tag.
+
+    Only the first _PREFIX_SIZE bytes are read unless they contain no match, since
+    version assignments conventionally sit near the top of the file. The rest of a
+    file larger than _MMAP_MIN_SIZE is searched through a read-only memory map
+    instead of being copied into memory. Only when the tag appears in the file but
+    no line starting with it matches, or the matched value is not UTF-8, is the
+    whole file parsed with _parse_version(), which honours a coding declaration; a
+    file that does not parse is searched again, allowing indented assignments. mtime_ns is not read; it and size are part of the cache
+    key so that a modified file misses the cache.
+
+    Args:
+        path: Filesystem path of the Python file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        version_tag: The variable name to search for
+
+    Returns:
+        The version string if found, None otherwise
+    """
+    pattern = _pattern_for(version_tag)
+    needle = version_tag.encode("utf-8")
+
+    try:
+        with open(path, "rb") as f:
+            data = f.read(_PREFIX_SIZE)
+            try:
+                if len(data) < _PREFIX_SIZE:
+                    version = _search(pattern, needle, data, len(data))
+                else:
+                    # The prefix may end mid-line; only its complete lines are searched
+                    version = _search(pattern, needle, data, data.rfind(b"\n"))
+                    if version is None and size <= _MMAP_MIN_SIZE:
+                        data += f.read()
+                        version = _search(pattern, needle, data, len(data))
+                    elif version is None:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                            version = _search(pattern, needle, mapped, len(mapped))
+                            if version is None and mapped.find(needle) != -1:
+                                data = mapped[:]
+            except UnicodeDecodeError:
+                # Not UTF-8, e.g. under a PEP 263 coding declaration: leave the
+                # decoding to _parse_version()
+                f.seek(0)
+                version, data = None, f.read()
+    except (OSError, ValueError):
+        # ValueError: mmap of a file truncated to empty since it was stat'ed
+        return None
+
+    if version is None and needle in data:
+        try:
+            version = _parse_version(data, version_tag)
+        except (SyntaxError, ValueError, RecursionError):
+            # Not valid Python: accept an indented assignment as text instead
+            try:
+                version = _search(_pattern_for(version_tag, indented=True), needle, data, len(data))
+            except UnicodeDecodeError:
+                version = None
+    return version
+
+
+def extract_version_from_file(file_path: str | os.PathLike[str], version_tag: str = "__version__") -> str | None:
+    """Extract version value from a Python file.
+
+    Searches for a line assigning a quoted string to version_tag (e.g., __version__ = "1.0.0")
+    and returns the assigned string value. The file is matched as text with a regular
+    expression and is never imported:
+
+    - version_tag must start the line, without indentation
+    - the value must be non-empty, in matching single or double quotes on the same
+      line, and contain no quote characters
+    - only whitespace and a comment may follow the closing quote, so computed
+      values such as "1.0" + "-dev" report no version
+    - the first matching line wins
+
+    If the tag appears in the file but no line matches, the file is parsed as Python
+    and the first non-empty string constant assigned to the tag is returned,
+    module-level assignments before nested ones. This covers indented assignments
+    (in if/try blocks), chained and parenthesized assignments, u"" literals, values
+    containing the other quote character and CR-only line endings. Files with
+    invalid syntax are instead scanned as text for the first matching line,
+    indented or not.
+
+    Results are cached by path, modification time, size and tag, so repeated scans of
+    unchanged files skip the read. Files modified within the last two seconds are
+    read without caching, since a coarse filesystem timestamp may not yet reflect a
+    further change. Use clear_version_cache() to drop cached results.
+
+    Args:
+        file_path: Path to the Python file to scan, as a Path or a plain string
+        version_tag: The variable name to search for (default: '__version__')
+
+    Returns:
+        The version string if found, None if the file cannot be read, the tag is not
+        assigned a quoted string, or the assigned string is empty
+    """
+    return _make_extractor(version_tag)(file_path)
+
+
+def _make_extractor(version_tag: str) -> Callable[[str | os.PathLike[str]], str | None]:
+    """Return extract_version_from_file() specialized to one version tag.
+
+    The tag and the functions the extractor calls are bound as closure variables,
+    so scans that build one extractor and call it for every package file skip the
+    per-call global lookups and argument passing. Files modified within
+    _RACY_WINDOW_NS of now bypass the cache.
+
+    Args:
+        version_tag: The variable name to search for
+
+    Returns:
+        Function taking a file path and returning its version, or None
+    """
+    stat = os.stat
+    fspath = os.fspath
+    now_ns = time.time_ns
+    racy_window_ns = _RACY_WINDOW_NS
+    read_cached = _read_version
+    read_uncached = _read_version.__wrapped__
+
+    def extract(file_path: str | os.PathLike[str]) -> str | None:
+        try:
+            st = stat(file_path)
+        except OSError:
+            return None
+        read = read_uncached if now_ns() - st.st_mtime_ns < racy_window_ns else read_cached
+        return read(fspath(file_path), st.st_mtime_ns, st.st_size, version_tag)
+
+    return extract
+
+
+def clear_version_cache() -> None:
+    """Clear cached results of extract_version_from_file() and cached vendor directory listings."""
+    _read_version.cache_clear()
+    _read_package_names.cache_clear()
+
+
+@functools.lru_cache(maxsize=256)
+def _read_package_names(vendor_path: str, mtime_ns: int) -> tuple[str, ...]:
+    """List the package directory names of a vendor directory, sorted.
+
+    Uses os.scandir() so the directory check comes from the directory read itself
+    rather than a stat() per entry. Files, symlinks and names starting with an
+    underscore are skipped. mtime_ns is not read; it is part of the cache key so
+    that adding, removing or renaming a package misses the cache.
+
+    Args:
+        vendor_path: Filesystem path of the vendor directory
+        mtime_ns: Modification time of the vendor directory in nanoseconds
+
+    Returns:
+        Sorted names of the package directories
+    """
+    with os.scandir(vendor_path) as entries:
+        return tuple(sorted(e.name for e in entries if e.is_dir(follow_symlinks=False) and e.name[:1] != "_"))
+
+
+def _list_package_names(vendor_path: str) -> tuple[str, ...]:
+    """List the package directory names of a vendor directory, sorted.
+
+    The listing is cached by directory path and modification time, so repeated
+    scans of an unchanged vendor directory skip the directory read. Only the
+    listing is cached: edits inside a package do not touch the vendor directory's
+    modification time, so versions are always resolved through the per-file cache
+    of extract_version_from_file(). A directory modified within _RACY_WINDOW_NS of
+    now is listed without caching. Sorting the bare names up front means results
+    built in this order need no sort of their own.
+
+    Args:
+        vendor_path: Filesystem path of the vendor directory
+
+    Returns:
+        Sorted names of the package directories
+    """
+    mtime_ns = os.stat(vendor_path).st_mtime_ns
+    if time.time_ns() - mtime_ns < _RACY_WINDOW_NS:
+        return _read_package_names.__wrapped__(vendor_path, mtime_ns)
+    return _read_package_names(vendor_path, mtime_ns)
+
+
+def _resolve_package_version(
+    package_dir: str,
+    extract: Callable[[str], str | None],
+    vendor_dir: str | None = None,
+) -> tuple[str | None, bool]:
+    """Find the version of a package from its __init__.py, falling back to __main__.py.
+
+    One os.scandir() of the package directory tells which of the files exist (and
+    whether it holds a nested vendor directory), so absent files cost no stat()
+    calls, and the entries' own paths are passed on as plain strings. __main__.py
+    is only read when __init__.py yields no version.
+
+    Args:
+        package_dir: Filesystem path of the package directory
+        extract: Version extractor for the scan's tag, from _make_extractor()
+        vendor_dir: Name of a nested vendor subdirectory to look for, if any
+
+    Returns:
+        (version, has_nested_vendor) where version is None if not found
+    """
+    init_file: str | None = None
+    main_file: str | None = None
+    has_nested_vendor = False
+    with os.scandir(package_dir) as entries:
+        for entry in entries:
+            if entry.name == "__init__.py":
+                init_file = entry.path if entry.is_file() else None
+            elif entry.name == "__main__.py":
+                main_file = entry.path if entry.is_file() else None
+            elif entry.name == vendor_dir:
+                has_nested_vendor = entry.is_dir()
+
+    version = extract(init_file) if init_file is not None else None
+    if version is None and main_file is not None:
+        version = extract(main_file)
+
+    return version, has_nested_vendor
+
+
 def scan_vendor_packages(
     target_path: Path | str,
     vendor_dir: str = "_vendor",
     version_tag: str = "__version__",
-) -> list[VersionInfo]:
+    max_workers: int | None = None,
+) -> list[PackageVersion]:
     """Scan all packages in a vendor directory and extract version information.
 
     For each package found in the vendor directory, searches for the version_tag in:
@@ -93,47 +493,99 @@ def scan_vendor_packages(
         target_path: Path to the target project directory
         vendor_dir: Name of the vendor subdirectory (default: '_vendor')
         version_tag: The variable name to search for (default: '__version__')
+        max_workers: Maximum threads used to read package versions (default:
+            min(32, 4 * CPU count)), capped at the number of packages. Vendor
+            directories with fewer than 4 packages, or max_workers <= 1, are scanned
+            serially.
 
     Returns:
-        List of VersionInfo dicts with package_name and version (None if not found)
+        List of PackageVersion records with package_name and version (None if not
+        found), sorted by package_name
 
     Raises:
         ValueError: If target_path or vendor directory doesn't exist
     """
-    target_path = Path(target_path)
-    vendor_path = target_path / vendor_dir
+    vendor_path = os.fspath(_validated_vendor_path(target_path, vendor_dir))
 
-    if not target_path.exists():
-        raise ValueError(f"Target path does not exist: {target_path}")
+    package_names = _list_package_names(vendor_path)
+    extract = _make_extractor(version_tag)
 
-    if not vendor_path.exists():
-        raise ValueError(f"Vendor directory does not exist: {vendor_path}")
+    def resolve(package_name: str) -> PackageVersion:
+        version, _ = _resolve_package_version(os.path.join(vendor_path, package_name), extract)
+        return PackageVersion(package_name, version)
+
+    if max_workers is None:
+        max_workers = _DEFAULT_MAX_WORKERS
+
+    if max_workers <= 1 or len(package_names) < _PARALLEL_MIN_PACKAGES:
+        versions = [resolve(package_name) for package_name in package_names]
+    else:
+        # Version lookups are file reads; threads let their I/O latencies overlap.
+        # No more threads than packages, since each thread handles at least one
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(package_names))) as executor:
+            versions = list(executor.map(resolve, package_names))
+
+    return versions
+
+
+def _iter_nested_packages(
+    vendor_path: str,
+    vendor_dir: str,
+    version_tag: str,
+    depth: int = 0,
+    parent_package: str | None = None,
+) -> Iterator[tuple[int, str | None, str, str | None]]:
+    """Walk a vendor directory and its nested vendor directories depth-first.
 
-    versions: list[VersionInfo] = []
+    Uses an explicit stack of per-directory name iterators rather than recursion,
+    so nesting depth is not bounded by the interpreter's recursion limit.
 
-    # Iterate through all subdirectories in the vendor directory
-    for package_dir in sorted(vendor_path.iterdir()):
-        if not package_dir.is_dir() or package_dir.name.startswith("_"):
-            # Skip hidden directories and files
+    Args:
+        vendor_path: Filesystem path of the vendor directory to walk
+        vendor_dir: Name of nested vendor subdirectories
+        version_tag: The variable name to search for
+        depth: Nesting depth of vendor_path
+        parent_package: Name of the package containing vendor_path, if any
+
+    Yields:
+        (depth, parent_package, package_name, version) tuples in pre-order, with
+        siblings sorted by package name
+    """
+    extract = _make_extractor(version_tag)
+    stack = [(depth, parent_package, vendor_path, iter(_list_package_names(vendor_path)))]
+    while stack:
+        level, parent, path, names = stack[-1]
+        package_name = next(names, None)
+        if package_name is None:
+            stack.pop()
             continue
 
-        package_name = package_dir.name
-        version: str | None = None
+        package_dir = os.path.join(path, package_name)
+        version, has_nested_vendor = _resolve_package_version(package_dir, extract, vendor_dir)
+        yield level, parent, package_name, version
 
-        # Try __init__.py first
-        init_file = package_dir / "__init__.py"
-        if init_file.exists():
-            version = extract_version_from_file(init_file, version_tag)
+        # Descend into a nested vendor directory before moving to the next sibling
+        if has_nested_vendor:
+            nested_vendor_path = os.path.join(package_dir, vendor_dir)
+            stack.append((level + 1, package_name, nested_vendor_path, iter(_list_package_names(nested_vendor_path))))
 
-        # If not found, try __main__.py
-        if version is None:
-            main_file = package_dir / "__main__.py"
-            if main_file.exists():
-                version = extract_version_from_file(main_file, version_tag)
 
-        versions.append({"package_name": package_name, "version": version})
+def _validated_vendor_path(target_path: Path | str, vendor_dir: str) -> Path:
+    """Return target_path / vendor_dir after checking both exist.
 
-    return versions
+    Raises:
+        ValueError: If target_path or vendor directory doesn't exist
+    """
+    target_path = Path(target_path)
+    vendor_path = target_path / vendor_dir
+
+    if not target_path.exists():
+        raise ValueError(f"Target path does not exist: {target_path}")
+
+    if not vendor_path.exists():
+        raise ValueError(f"Vendor directory does not exist: {vendor_path}")
+
+    return vendor_path
 
 
 def scan_vendor_packages_nested(
@@ -142,7 +594,7 @@ def scan_vendor_packages_nested(
     version_tag: str = "__version__",
     depth: int = 0,
     parent_package: str | None = None,
-) -> list[NestedVersionInfo]:
+) -> list[NestedPackageVersion]:
     """Recursively scan vendor directories including nested packages.
 
     Scans the top-level vendor directory and recursively scans nested _vendor
@@ -153,102 +605,139 @@ def scan_vendor_packages_nested(
         target_path: Path to the target project directory
         vendor_dir: Name of the vendor subdirectory (default: '_vendor')
         version_tag: The variable name to search for (default: '__version__')
-        depth: Current nesting depth (default: 0, internal use for recursion)
-        parent_package: Name of parent package (default: None, internal use)
+        depth: Nesting depth recorded for top-level packages (default: 0)
+        parent_package: Parent recorded for top-level packages (default: None)
 
     Returns:
-        List of NestedVersionInfo dicts with hierarchical structure
+        List of NestedPackageVersion records with hierarchical structure
 
     Raises:
         ValueError: If target_path or vendor directory doesn't exist
     """
-    target_path = Path(target_path)
-    vendor_path = target_path / vendor_dir
-
     if depth == 0:  # Only validate at top level
-        if not target_path.exists():
-            raise ValueError(f"Target path does not exist: {target_path}")
+        vendor_path = _validated_vendor_path(target_path, vendor_dir)
+    else:
+        vendor_path = Path(target_path) / vendor_dir
 
-        if not vendor_path.exists():
-            raise ValueError(f"Vendor directory does not exist: {vendor_path}")
+    versions: list[NestedPackageVersion] = []
 
-    versions: list[NestedVersionInfo] = []
+    # children[n] is the list that receives packages at relative depth n: the
+    # result itself, then the nested_packages of the latest package at each level
+    children = [versions]
+    for package_depth, parent, package_name, version in _iter_nested_packages(
+        os.fspath(vendor_path), vendor_dir, version_tag, depth, parent_package
+    ):
+        level = package_depth - depth
+        del children[level + 1 :]
 
-    # Iterate through all subdirectories in the vendor directory
-    for package_dir in sorted(vendor_path.iterdir()):
-        if not package_dir.is_dir() or package_dir.name.startswith("_"):
-            # Skip hidden directories and files
-            continue
-
-        package_name = package_dir.name
-        version: str | None = None
-
-        # Try __init__.py first
-        init_file = package_dir / "__init__.py"
-        if init_file.exists():
-            version = extract_version_from_file(init_file, version_tag)
-
-        # If not found, try __main__.py
-        if version is None:
-            main_file = package_dir / "__main__.py"
-            if main_file.exists():
-                version = extract_version_from_file(main_file, version_tag)
-
-        # Create the version info entry
-        version_info: NestedVersionInfo = {
-            "package_name": package_name,
-            "version": version,
-            "depth": depth,
-            "parent_package": parent_package,
-        }
-
-        # Check for nested vendor directory
-        nested_vendor_path = package_dir / vendor_dir
-        if nested_vendor_path.exists() and nested_vendor_path.is_dir():
-            # Recursively scan nested vendors
-            nested_packages = scan_vendor_packages_nested(
-                target_path=package_dir,
-                vendor_dir=vendor_dir,
-                version_tag=version_tag,
-                depth=depth + 1,
-                parent_package=package_name,
-            )
-            version_info["nested_packages"] = nested_packages
-        else:
-            version_info["nested_packages"] = []
-
-        versions.append(version_info)
+        version_info = NestedPackageVersion(package_name, version, package_depth, parent)
+        children[level].append(version_info)
+        children.append(version_info.nested_packages)
 
     return versions
 
 
-def format_version_output(versions: list[VersionInfo]) -> str:
+def iter_formatted_nested(
+    target_path: Path | str,
+    vendor_dir: str = "_vendor",
+    version_tag: str = "__version__",
+) -> Iterator[str]:
+    """Scan vendor directories recursively and yield formatted lines as packages are found.
+
+    Produces the same lines as format_nested_version_output(scan_vendor_packages_nested(...))
+    without building the nested structure first.
+
+    Args:
+        target_path: Path to the target project directory
+        vendor_dir: Name of the vendor subdirectory (default: '_vendor')
+        version_tag: The variable name to search for (default: '__version__')
+
+    Yields:
+        One line per package: indentation + 'package-name version', with '?' for
+        missing versions
+
+    Raises:
+        ValueError: If target_path or vendor directory doesn't exist (raised when
+            iteration starts)
+    """
+    vendor_path = os.fspath(_validated_vendor_path(target_path, vendor_dir))
+
+    for depth, _, package_name, version in _iter_nested_packages(vendor_path, vendor_dir, version_tag):
+        yield f"{_indent(depth)}{package_name} {version if version is not None else _UNKNOWN_VERSION}"
+
+
+def format_version_lines(versions: Iterable[PackageVersion | VersionInfo]) -> Iterator[str]:
+    """Format version information as console lines, one at a time.
+
+    Formats each package as 'package-name version' with '?' for missing (None)
+    versions, the same rule as the nested formatters. Lines are generated lazily,
+    so callers can stream them to a file or stdout; the generator can be consumed
+    only once, so wrap it in list() to take its len() or iterate it twice.
+
+    Args:
+        versions: Version records (or equivalent VersionInfo dicts) to format
+
+    Yields:
+        One formatted line per package, without trailing newlines
+    """
+    unknown = _UNKNOWN_VERSION
+    for info in versions:
+        version = info["version"]
+        yield f"{info['package_name']} {version if version is not None else unknown}"
+
+
+def format_version_output(versions: Iterable[PackageVersion | VersionInfo]) -> str:
     """Format version information for console output.
 
     Formats as 'package-name version' with '?' for missing versions.
 
     Args:
-        versions: List of VersionInfo dicts to format
+        versions: Version records (or equivalent VersionInfo dicts) to format
 
     Returns:
         Formatted output string with one package per line
     """
-    lines = []
-    for info in versions:
-        version = info["version"] if info["version"] is not None else "?"
-        lines.append(f"{info['package_name']} {version}")
+    return "\n".join(format_version_lines(versions))
+
+
+def format_nested_version_lines(versions: Sequence[NestedPackageVersion | NestedVersionInfo]) -> list[str]:
+    """Format nested version information as indented console lines.
 
-    return "\n".join(lines)
+    Each nesting level adds two spaces of indentation; missing versions show as '?'.
 
+    Args:
+        versions: NestedPackageVersion records or NestedVersionInfo dicts with
+            hierarchical structure
 
-def format_nested_version_output(versions: list[NestedVersionInfo]) -> str:
+    Returns:
+        One formatted line per package in depth-first order, without trailing newlines
+    """
+    lines: list[str] = []
+
+    # Depth-first walk with an explicit stack; children are pushed in reverse so
+    # they pop in their original order
+    stack: list[tuple[int, NestedPackageVersion | NestedVersionInfo]] = [(0, info) for info in reversed(versions)]
+    while stack:
+        level, info = stack.pop()
+        version = info["version"] if info["version"] is not None else _UNKNOWN_VERSION
+        lines.append(f"{_indent(level)}{info['package_name']} {version}")
+
+        nested = info.get("nested_packages")
+        if nested:
+            stack.extend((level + 1, child) for child in reversed(nested))
+
+    return lines
+
+
+def format_nested_version_output(versions: Sequence[NestedPackageVersion | NestedVersionInfo]) -> str:
     """Format nested version information with hierarchy visualization.
 
     Uses indentation to show nesting levels and parent-child relationships.
     Format: indentation + 'package-name version [parent: parent-name]'
 
     Args:
-        versions: List of NestedVersionInfo dicts with hierarchical structure
+        versions: NestedPackageVersion records or NestedVersionInfo dicts with
+            hierarchical structure
 
     Returns:
         Formatted output string with hierarchy indentation
@@ -259,34 +748,4 @@ def format_nested_version_output(versions: list[NestedVersionInfo]) -> str:
             library-f 3.0.0
             library-g 4.0.0
     """
-
-    def format_recursive(
-        items: list[NestedVersionInfo],
-        indent: int = 0,
-    ) -> list[str]:
-        """Recursively format nested version info with indentation.
-
-        Args:
-            items: List of NestedVersionInfo items to format
-            indent: Current indentation level (number of spaces)
-
-        Returns:
-            List of formatted lines
-        """
-        lines = []
-        indent_str = "  " * indent
-
-        for info in items:
-            version = info["version"] if info["version"] is not None else "?"
-            line = f"{indent_str}{info['package_name']} {version}"
-            lines.append(line)
-
-            # Recursively format nested packages
-            if info.get("nested_packages"):
-                nested_lines = format_recursive(info["nested_packages"], indent + 1)
-                lines.extend(nested_lines)
-
-        return lines
-
-    lines = format_recursive(versions)
-    return "\n".join(lines)
+    return "\n".join(format_nested_version_lines(versions))
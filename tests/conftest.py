@@ -0,0 +1,20 @@
+"""Shared pytest configuration for splurge-vendor-sync tests."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+from hypothesis import settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+# Keep the Hypothesis example database on a RAM-backed filesystem when one is
+# available. Each pytest-xdist worker gets its own directory so workers never
+# contend for the same files; keying on the worker id rather than the pid keeps
+# the path stable across runs so saved failing examples are still replayed.
+_DB_ROOT = Path("/dev/shm") if os.path.isdir("/dev/shm") else Path(tempfile.gettempdir())
+_DB_PATH = _DB_ROOT / "splurge-vendor-sync-hypothesis" / os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+settings.register_profile("splurge", database=DirectoryBasedExampleDatabase(_DB_PATH))
+settings.load_profile("splurge")
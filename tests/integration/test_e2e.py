@@ -2,28 +2,27 @@
 
 from __future__ import annotations
 
-import tempfile
-from collections.abc import Generator
+import io
+from contextlib import redirect_stdout
 from pathlib import Path
 
 import pytest
 
+from splurge_vendor_sync.exceptions import SplurgeVendorSyncError
 from splurge_vendor_sync.main import main
 from splurge_vendor_sync.sync import sync_vendor
 
 
 @pytest.fixture
-def temp_workspace() -> Generator[tuple[Path, Path], None, None]:
+def temp_workspace(tmp_path: Path) -> tuple[Path, Path]:
     """Create temporary workspace for integration tests."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base = Path(tmpdir)
-        source = base / "source"
-        target = base / "target"
+    source = tmp_path / "source"
+    target = tmp_path / "target"
 
-        source.mkdir(exist_ok=True)
-        target.mkdir(exist_ok=True)
+    source.mkdir()
+    target.mkdir()
 
-        yield source, target
+    return source, target
 
 
 class TestE2EBasicSync:
@@ -207,8 +206,6 @@ class TestE2EErrorHandling:
 
     def test_e2e_missing_source_directory(self, temp_workspace: tuple[Path, Path]) -> None:
         """Test handling of missing source directory."""
-        from splurge_vendor_sync.exceptions import SplurgeVendorSyncError
-
         _, target = temp_workspace
 
         with pytest.raises(SplurgeVendorSyncError):
@@ -216,8 +213,6 @@ class TestE2EErrorHandling:
 
     def test_e2e_missing_package(self, temp_workspace: tuple[Path, Path]) -> None:
         """Test handling of missing package in source."""
-        from splurge_vendor_sync.exceptions import SplurgeVendorSyncError
-
         source, target = temp_workspace
 
         with pytest.raises(SplurgeVendorSyncError):
@@ -225,8 +220,6 @@ class TestE2EErrorHandling:
 
     def test_e2e_invalid_target_path(self, temp_workspace: tuple[Path, Path]) -> None:
         """Test handling of invalid target path."""
-        from splurge_vendor_sync.exceptions import SplurgeVendorSyncError
-
         source, _ = temp_workspace
 
         pkg = source / "mylib"
@@ -310,9 +303,6 @@ class TestE2ENestedVendorScanning:
         (pkg_b / "__init__.py").write_text('__version__ = "2.0.0"\n')
 
         # Run scan via main
-        import io
-        from contextlib import redirect_stdout
-
         captured_output = io.StringIO()
         with redirect_stdout(captured_output):
             exit_code = main(target_path=target, scan="__version__")
@@ -344,9 +334,6 @@ class TestE2ENestedVendorScanning:
             if level < 3:  # Don't create _vendor for the last level
                 current.mkdir()
 
-        import io
-        from contextlib import redirect_stdout
-
         captured_output = io.StringIO()
         with redirect_stdout(captured_output):
             exit_code = main(target_path=target, scan="__version__")
@@ -398,9 +385,6 @@ class TestE2ENestedVendorScanning:
         pkg_e.mkdir()
         (pkg_e / "__init__.py").write_text('__version__ = "5.0.0"\n')
 
-        import io
-        from contextlib import redirect_stdout
-
         captured_output = io.StringIO()
         with redirect_stdout(captured_output):
             exit_code = main(target_path=target, scan="__version__")
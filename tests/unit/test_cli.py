@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 import tempfile
 from collections.abc import Generator
 from pathlib import Path
@@ -13,23 +14,21 @@ from splurge_vendor_sync.cli import main as cli_main
 
 
 @pytest.fixture
-def temp_workspace() -> Generator[tuple[Path, Path], None, None]:
+def temp_workspace(tmp_path: Path) -> tuple[Path, Path]:
     """Create temporary workspace."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base = Path(tmpdir)
-        source = base / "source"
-        target = base / "target"
+    source = tmp_path / "source"
+    target = tmp_path / "target"
 
-        source.mkdir(exist_ok=True)
-        target.mkdir(exist_ok=True)
+    source.mkdir()
+    target.mkdir()
 
-        # Create a sample package
-        package = source / "test_pkg"
-        package.mkdir()
-        (package / "module.py").write_text("print('test')")
-        (package / "config.json").write_text('{"key": "value"}')
+    # Create a sample package
+    package = source / "test_pkg"
+    package.mkdir()
+    (package / "module.py").write_text("print('test')")
+    (package / "config.json").write_text('{"key": "value"}')
 
-        yield source, target
+    return source, target
 
 
 class TestCLIBasic:
@@ -38,8 +37,6 @@ class TestCLIBasic:
     def test_cli_help(self, capsys) -> None:
         """Test CLI help output."""
         with pytest.raises(SystemExit) as exc_info:
-            import sys
-
             original_argv = sys.argv
             try:
                 sys.argv = ["splurge-vendor-sync", "--help"]
@@ -53,8 +50,6 @@ class TestCLIBasic:
     def test_cli_version(self, capsys) -> None:
         """Test CLI version output."""
         with pytest.raises(SystemExit) as exc_info:
-            import sys
-
             original_argv = sys.argv
             try:
                 sys.argv = ["splurge-vendor-sync", "--version"]
@@ -67,8 +62,6 @@ class TestCLIBasic:
 
     def test_cli_missing_required_args(self) -> None:
         """Test CLI with missing required arguments for sync mode."""
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = ["splurge-vendor-sync"]
@@ -82,8 +75,6 @@ class TestCLIBasic:
         """Test successful CLI execution."""
         source, target = temp_workspace
 
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -104,8 +95,6 @@ class TestCLIBasic:
         """Test CLI with custom vendor directory."""
         source, target = temp_workspace
 
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -129,8 +118,6 @@ class TestCLIBasic:
         """Test CLI with custom extensions."""
         source, target = temp_workspace
 
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -153,8 +140,6 @@ class TestCLIBasic:
         """Test CLI with short -e option for extensions."""
         source, target = temp_workspace
 
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -177,8 +162,6 @@ class TestCLIBasic:
         """Test CLI with verbose option."""
         source, target = temp_workspace
 
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -200,8 +183,6 @@ class TestCLIBasic:
         """Test CLI with short -v option for verbose."""
         source, target = temp_workspace
 
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -223,8 +204,6 @@ class TestCLIBasic:
         """Test CLI with invalid source path."""
         _, target = temp_workspace
 
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -245,8 +224,6 @@ class TestCLIBasic:
         """Test CLI with nonexistent package."""
         source, target = temp_workspace
 
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -267,8 +244,6 @@ class TestCLIBasic:
         """Test CLI with combined --verbose and --ext flags."""
         source, target = temp_workspace
 
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -294,8 +269,6 @@ class TestCLIBasic:
 
     def test_cli_version_output(self, capsys) -> None:
         """Test CLI version output contains expected version string."""
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = ["splurge-vendor-sync", "--version"]
@@ -313,8 +286,6 @@ class TestCLIBasic:
         """Test CLI with all optional flags combined."""
         source, target = temp_workspace
 
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -375,8 +346,6 @@ class TestCLIScan:
 
     def test_cli_scan_default_version_tag(self, temp_vendor_structure: Path, capsys) -> None:
         """Test scan with default __version__ tag."""
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -408,8 +377,6 @@ class TestCLIScan:
         pkg.mkdir()
         (pkg / "__init__.py").write_text('MY_VERSION = "5.0.0"\n')
 
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -446,8 +413,6 @@ class TestCLIScan:
             pkg.mkdir()
             (pkg / "__init__.py").write_text('__version__ = "1.5.0"\n')
 
-            import sys
-
             original_argv = sys.argv
             try:
                 sys.argv = [
@@ -472,8 +437,6 @@ class TestCLIScan:
 
     def test_cli_scan_missing_target_path(self) -> None:
         """Test scan fails without target path."""
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -492,8 +455,6 @@ class TestCLIScan:
 
     def test_cli_scan_invalid_target_path(self) -> None:
         """Test scan fails with invalid target path."""
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -514,8 +475,6 @@ class TestCLIScan:
 
     def test_cli_scan_ignores_sync_parameters(self, temp_vendor_structure: Path, capsys) -> None:
         """Test that scan mode ignores source and package parameters."""
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -548,8 +507,6 @@ class TestCLIScan:
             vendor = target / "_vendor"
             vendor.mkdir()
 
-            import sys
-
             original_argv = sys.argv
             try:
                 sys.argv = [
@@ -573,8 +530,6 @@ class TestCLIScan:
 
     def test_cli_scan_with_verbose_flag(self, temp_vendor_structure: Path, capsys) -> None:
         """Test scan with verbose flag."""
-        import sys
-
         original_argv = sys.argv
         try:
             sys.argv = [
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import tempfile
-from collections.abc import Generator
 from pathlib import Path
 
 import pytest
@@ -12,22 +10,20 @@ from splurge_vendor_sync.main import main
 
 
 @pytest.fixture
-def temp_workspace() -> Generator[tuple[Path, Path], None, None]:
+def temp_workspace(tmp_path: Path) -> tuple[Path, Path]:
     """Create temporary workspace."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base = Path(tmpdir)
-        source = base / "source"
-        target = base / "target"
+    source = tmp_path / "source"
+    target = tmp_path / "target"
 
-        source.mkdir(exist_ok=True)
-        target.mkdir(exist_ok=True)
+    source.mkdir()
+    target.mkdir()
 
-        # Create a sample package
-        package = source / "test_pkg"
-        package.mkdir()
-        (package / "module.py").write_text("print('test')")
+    # Create a sample package
+    package = source / "test_pkg"
+    package.mkdir()
+    (package / "module.py").write_text("print('test')")
 
-        yield source, target
+    return source, target
 
 
 class TestMainBasic:
@@ -2,97 +2,253 @@
 
 from __future__ import annotations
 
+import os
 import shutil
-import tempfile
-from collections.abc import Generator
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from splurge_vendor_sync._vendor.splurge_safe_io.exceptions import (
+    SplurgeSafeIoError,
+    SplurgeSafeIoUnicodeError,
+)
 from splurge_vendor_sync.exceptions import (
     SplurgeVendorSyncOSError,
     SplurgeVendorSyncTypeError,
     SplurgeVendorSyncValueError,
 )
-from splurge_vendor_sync.sync import sync_vendor
+from splurge_vendor_sync.sync import SyncResult, sync_vendor
+
+# A path that is never created; used where a test must fail before any I/O
+NONEXISTENT_PATH = Path("/nonexistent-splurge-vendor-sync")
+
+# Sample package layout, keyed by POSIX path relative to the package root
+SAMPLE_FILES = {
+    "module1.py": "print('module1')",
+    "module2.py": "print('module2')",
+    "config.json": '{"key": "value"}',
+    "data.txt": "data",
+    "subdir/nested.py": "print('nested')",
+}
+
+
+def _touch(path: Path, data: bytes) -> None:
+    """Write data to path with raw fd calls, skipping the text-wrapper setup of write_text()."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="session")
+def _pristine_package(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the sample package layout once per session as a copy template."""
+    package = tmp_path_factory.mktemp("pristine") / "test_package"
+
+    for rel_path, content in SAMPLE_FILES.items():
+        path = package / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _touch(path, content.encode())
+
+    return package
+
+
+def _collect(root: Path) -> set[str]:
+    """Collect the relative POSIX paths of all files under root.
+
+    Walks the tree with os.scandir() so each directory costs one read, rather
+    than one stat per Path.exists() check.
+    """
+    result: set[str] = set()
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    result.add(os.path.relpath(entry.path, root).replace(os.sep, "/"))
+    return result
+
+
+class _SyncedOutputs(dict[tuple[str, str, type], tuple[SyncResult, Path]]):
+    """Memoized sync_vendor() outputs of one source package.
+
+    Keys are (extensions, vendor, path_type). A missing key syncs the package
+    into a fresh target directory and stores the result together with the
+    vendored package directory.
+    """
+
+    def __init__(self, package: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+        super().__init__()
+        self._package = package
+        self._tmp_path_factory = tmp_path_factory
+
+    def __missing__(self, key: tuple[str, str, type]) -> tuple[SyncResult, Path]:
+        extensions, vendor, path_type = key
+        target = self._tmp_path_factory.mktemp("synced")
+        result = sync_vendor(
+            source_path=path_type(self._package.parent),
+            target_path=path_type(target),
+            package=self._package.name,
+            vendor=vendor,
+            extensions=extensions,
+        )
+        self[key] = (result, target / vendor / self._package.name)
+        return self[key]
+
+
+@pytest.fixture(scope="session")
+def synced_outputs(tmp_path_factory: pytest.TempPathFactory, _pristine_package: Path) -> _SyncedOutputs:
+    """Share sync_vendor() outputs of the pristine package across the session.
+
+    Only for tests that read the synced tree; tests that re-sync or mutate it
+    must build their own workspace.
+    """
+    return _SyncedOutputs(_pristine_package, tmp_path_factory)
 
 
 @pytest.fixture
-def temp_workspace() -> Generator[tuple[Path, Path, Path], None, None]:
+def temp_workspace(tmp_path: Path) -> tuple[Path, Path, Path]:
     """Create temporary workspace with source and target directories."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base = Path(tmpdir)
-        source = base / "source"
-        target = base / "target"
+    source = tmp_path / "source"
+    target = tmp_path / "target"
+    source.mkdir()
+    target.mkdir()
+
+    return source, target, tmp_path
 
-        source.mkdir(exist_ok=True)
-        target.mkdir(exist_ok=True)
 
-        yield source, target, base
+@pytest.fixture
+def sample_package_minimal(temp_workspace: tuple[Path, Path, Path], _pristine_package: Path) -> Path:
+    """Copy the pristine sample package into the workspace source directory."""
+    source, _, _ = temp_workspace
+    package = source / _pristine_package.name
+    shutil.copytree(_pristine_package, package)
 
-        # Cleanup
-        for path in [source, target, base]:
-            if path.exists():
-                shutil.rmtree(path, ignore_errors=True)
+    return package
 
 
 @pytest.fixture
-def sample_package(temp_workspace: tuple[Path, Path, Path]) -> Path:
-    """Create a sample package with test files."""
-    source, _, _ = temp_workspace
-    package = source / "test_package"
+def sample_package_with_pycache(sample_package_minimal: Path) -> Path:
+    """Add a __pycache__ directory (which sync must skip) to the sample package."""
+    pycache = sample_package_minimal / "__pycache__"
+    pycache.mkdir()
+    _touch(pycache / "module1.cpython-312.pyc", b"compiled")
+
+    return sample_package_minimal
+
+
+def _lay_out_package(source: Path, target: Path, package_name: str, *, vendored: bool) -> None:
+    """Create a one-module package and, if vendored, its copy under target/_vendor.
+
+    The vendored copy is written directly rather than produced by a priming
+    sync_vendor() run.
+    """
+    package = source / package_name
     package.mkdir()
+    _touch(package / "module.py", b"test")
 
-    # Create test files
-    (package / "module1.py").write_text("print('module1')")
-    (package / "module2.py").write_text("print('module2')")
-    (package / "config.json").write_text('{"key": "value"}')
-    (package / "data.txt").write_text("data")
+    if vendored:
+        copy = target / "_vendor" / package_name
+        copy.mkdir(parents=True)
+        _touch(copy / "module.py", b"test")
 
-    # Create subdirectory with files
-    subdir = package / "subdir"
-    subdir.mkdir()
-    (subdir / "nested.py").write_text("print('nested')")
 
-    # Create __pycache__ directory (should be skipped)
-    pycache = package / "__pycache__"
-    pycache.mkdir()
-    (pycache / "module1.cpython-312.pyc").write_bytes(b"compiled")
+@pytest.fixture
+def pre_synced_workspace(temp_workspace: tuple[Path, Path, Path]) -> tuple[Path, Path, str]:
+    """Lay out a package and its vendored copy so the next sync has a tree to clean."""
+    source, target, _ = temp_workspace
+    _lay_out_package(source, target, "clean_pkg", vendored=True)
 
-    return package
+    return source, target, "clean_pkg"
 
 
 class TestSyncVendorBasic:
     """Test basic sync_vendor functionality."""
 
-    def test_sync_vendor_success(self, temp_workspace: tuple[Path, Path, Path], sample_package: Path) -> None:
-        """Test successful package synchronization."""
-        source, target, _ = temp_workspace
-        package_name = sample_package.name
-
-        result = sync_vendor(
-            source_path=source,
-            target_path=target,
-            package=package_name,
-            extensions="py;json",
-        )
+    @pytest.mark.parametrize(
+        ("extensions", "vendor", "path_type", "present", "absent", "files_copied"),
+        [
+            pytest.param(
+                "py;json",
+                "_vendor",
+                str,
+                ["module1.py", "module2.py", "config.json", "subdir/nested.py"],
+                ["data.txt"],
+                4,
+                id="success",
+            ),
+            pytest.param(
+                "py",
+                "_vendor",
+                str,
+                ["module1.py", "module2.py", "subdir/nested.py"],
+                ["config.json", "data.txt"],
+                3,
+                id="filters_extensions",
+            ),
+            pytest.param(
+                "py;json;txt",
+                "_vendor",
+                str,
+                ["module1.py", "config.json", "data.txt"],
+                [],
+                5,
+                id="multiple_extensions",
+            ),
+            pytest.param(
+                "py",
+                "custom_vendor",
+                str,
+                ["module1.py"],
+                ["config.json"],
+                3,
+                id="custom_vendor_dir",
+            ),
+            pytest.param(
+                "py",
+                "_vendor",
+                Path,
+                ["module1.py", "module2.py", "subdir/nested.py"],
+                ["config.json", "data.txt"],
+                3,
+                id="path_objects",
+            ),
+        ],
+    )
+    def test_sync_vendor_variants(
+        self,
+        synced_outputs: _SyncedOutputs,
+        extensions: str,
+        vendor: str,
+        path_type: type[str] | type[Path],
+        present: list[str],
+        absent: list[str],
+        files_copied: int,
+    ) -> None:
+        """Test synchronization of the sample package across argument variants."""
+        result, vendor_dir = synced_outputs[extensions, vendor, path_type]
 
         assert result["status"] == "success"
-        assert result["files_copied"] >= 3  # module1.py, module2.py, config.json
+        assert result["files_copied"] == files_copied
         assert result["files_removed"] == 0
         assert result["errors"] == []
 
-        # Verify files were copied
-        vendor_dir = target / "_vendor" / package_name
-        assert (vendor_dir / "module1.py").exists()
-        assert (vendor_dir / "module2.py").exists()
-        assert (vendor_dir / "config.json").exists()
+        copied = _collect(vendor_dir)
+        for rel_path in present:
+            assert rel_path in copied
+        for rel_path in absent:
+            assert rel_path not in copied
 
-    def test_sync_vendor_excludes_pycache(self, temp_workspace: tuple[Path, Path, Path], sample_package: Path) -> None:
+    def test_sync_vendor_excludes_pycache(
+        self, temp_workspace: tuple[Path, Path, Path], sample_package_with_pycache: Path
+    ) -> None:
         """Test that __pycache__ directories are excluded."""
         source, target, _ = temp_workspace
-        package_name = sample_package.name
+        package_name = sample_package_with_pycache.name
 
         result = sync_vendor(
             source_path=source,
@@ -102,220 +258,101 @@ class TestSyncVendorBasic:
         )
 
         vendor_dir = target / "_vendor" / package_name
-        assert not (vendor_dir / "__pycache__").exists()
+        assert not any(rel_path.startswith("__pycache__/") for rel_path in _collect(vendor_dir))
         assert result["status"] == "success"
 
-    def test_sync_vendor_filters_extensions(
-        self, temp_workspace: tuple[Path, Path, Path], sample_package: Path
-    ) -> None:
-        """Test that extension filtering works correctly."""
-        source, target, _ = temp_workspace
-        package_name = sample_package.name
-
-        result = sync_vendor(
-            source_path=source,
-            target_path=target,
-            package=package_name,
-            extensions="py",  # Only Python files
-        )
-
-        vendor_dir = target / "_vendor" / package_name
-        assert (vendor_dir / "module1.py").exists()
-        assert not (vendor_dir / "config.json").exists()
-        assert not (vendor_dir / "data.txt").exists()
-        assert result["files_copied"] == 3  # module1.py, module2.py, nested.py
-
-    def test_sync_vendor_clean_phase(self, temp_workspace: tuple[Path, Path, Path], sample_package: Path) -> None:
+    def test_sync_vendor_clean_phase(self, pre_synced_workspace: tuple[Path, Path, str]) -> None:
         """Test that clean phase removes existing files."""
-        source, target, _ = temp_workspace
-        package_name = sample_package.name
-
-        # First sync
-        result1 = sync_vendor(
-            source_path=source,
-            target_path=target,
-            package=package_name,
-            extensions="py;json",
-        )
-
-        assert result1["files_copied"] > 0
-        assert result1["files_removed"] == 0
+        source, target, package_name = pre_synced_workspace
 
         # Second sync - should remove old files
-        result2 = sync_vendor(
-            source_path=source,
-            target_path=target,
-            package=package_name,
-            extensions="py;json",
-        )
-
-        assert result2["files_removed"] > 0
-        assert result2["files_copied"] > 0
-        assert result2["status"] == "success"
-
-    def test_sync_vendor_custom_vendor_dir(self, temp_workspace: tuple[Path, Path, Path], sample_package: Path) -> None:
-        """Test synchronization with custom vendor directory name."""
-        source, target, _ = temp_workspace
-        package_name = sample_package.name
-
         result = sync_vendor(
             source_path=source,
             target_path=target,
             package=package_name,
-            vendor="custom_vendor",
-            extensions="py",
-        )
-
-        vendor_dir = target / "custom_vendor" / package_name
-        assert (vendor_dir / "module1.py").exists()
-        assert result["status"] == "success"
-
-    def test_sync_vendor_with_path_objects(self, temp_workspace: tuple[Path, Path, Path], sample_package: Path) -> None:
-        """Test that Path objects work as well as strings."""
-        source, target, _ = temp_workspace
-        package_name = sample_package.name
-
-        result = sync_vendor(
-            source_path=Path(source),
-            target_path=Path(target),
-            package=package_name,
-            extensions="py",
+            extensions="py;json",
         )
 
-        assert result["status"] == "success"
+        assert result["files_removed"] > 0
         assert result["files_copied"] > 0
+        assert result["status"] == "success"
 
 
 class TestSyncVendorValidation:
-    """Test input validation."""
+    """Test input validation.
 
-    def test_sync_vendor_invalid_source_type(self, temp_workspace: tuple[Path, Path, Path]) -> None:
-        """Test that invalid source_path type raises TypeError."""
-        _, target, _ = temp_workspace
+    Argument checks raise before any filesystem access, so these tests pass
+    paths that do not exist instead of building a workspace.
+    """
 
+    def test_sync_vendor_invalid_source_type(self) -> None:
+        """Test that invalid source_path type raises TypeError."""
         with pytest.raises(SplurgeVendorSyncTypeError):
             sync_vendor(
                 source_path=123,  # Invalid type
-                target_path=target,
+                target_path=NONEXISTENT_PATH,
                 package="test",
             )
 
-    def test_sync_vendor_invalid_target_type(
-        self, temp_workspace: tuple[Path, Path, Path], sample_package: Path
-    ) -> None:
+    def test_sync_vendor_invalid_target_type(self) -> None:
         """Test that invalid target_path type raises TypeError."""
-        source, _, _ = temp_workspace
-
         with pytest.raises(SplurgeVendorSyncTypeError):
             sync_vendor(
-                source_path=source,
+                source_path=NONEXISTENT_PATH,
                 target_path=456,  # Invalid type
                 package="test",
             )
 
-    def test_sync_vendor_invalid_package_type(self, temp_workspace: tuple[Path, Path, Path]) -> None:
+    def test_sync_vendor_invalid_package_type(self) -> None:
         """Test that invalid package type raises TypeError."""
-        source, target, _ = temp_workspace
-
         with pytest.raises(SplurgeVendorSyncTypeError):
             sync_vendor(
-                source_path=source,
-                target_path=target,
+                source_path=NONEXISTENT_PATH,
+                target_path=NONEXISTENT_PATH,
                 package=789,  # Invalid type
             )
 
-    def test_sync_vendor_empty_package(self, temp_workspace: tuple[Path, Path, Path]) -> None:
+    def test_sync_vendor_empty_package(self) -> None:
         """Test that empty package name raises ValueError."""
-        source, target, _ = temp_workspace
-
         with pytest.raises(SplurgeVendorSyncValueError):
             sync_vendor(
-                source_path=source,
-                target_path=target,
+                source_path=NONEXISTENT_PATH,
+                target_path=NONEXISTENT_PATH,
                 package="",  # Empty
             )
 
-    def test_sync_vendor_nonexistent_source(self, temp_workspace: tuple[Path, Path, Path]) -> None:
+    def test_sync_vendor_nonexistent_source(self, tmp_path: Path) -> None:
         """Test that nonexistent source path raises ValueError."""
-        _, target, _ = temp_workspace
-
         with pytest.raises(SplurgeVendorSyncValueError) as exc_info:
             sync_vendor(
-                source_path="/nonexistent/path",
-                target_path=target,
+                source_path=NONEXISTENT_PATH,
+                target_path=tmp_path,
                 package="test",
             )
         assert "path-not-found" in str(exc_info.value)
+        assert f"source_path does not exist: {NONEXISTENT_PATH}" in str(exc_info.value)
 
-    def test_sync_vendor_nonexistent_target(
-        self, temp_workspace: tuple[Path, Path, Path], sample_package: Path
-    ) -> None:
+    def test_sync_vendor_nonexistent_target(self, _pristine_package: Path) -> None:
         """Test that nonexistent target path raises ValueError."""
-        source, _, _ = temp_workspace
-
         with pytest.raises(SplurgeVendorSyncValueError) as exc_info:
             sync_vendor(
-                source_path=source,
-                target_path="/nonexistent/target",
-                package=sample_package.name,
+                source_path=_pristine_package.parent,
+                target_path=NONEXISTENT_PATH,
+                package=_pristine_package.name,
             )
         assert "path-not-found" in str(exc_info.value)
+        assert f"target_path does not exist: {NONEXISTENT_PATH}" in str(exc_info.value)
 
-    def test_sync_vendor_nonexistent_package(self, temp_workspace: tuple[Path, Path, Path]) -> None:
+    def test_sync_vendor_nonexistent_package(self, _pristine_package: Path, tmp_path: Path) -> None:
         """Test that nonexistent package raises ValueError."""
-        source, target, _ = temp_workspace
-
         with pytest.raises(SplurgeVendorSyncValueError) as exc_info:
             sync_vendor(
-                source_path=source,
-                target_path=target,
+                source_path=_pristine_package.parent,
+                target_path=tmp_path,
                 package="nonexistent_package",
             )
         assert "path-not-found" in str(exc_info.value)
-
-
-class TestSyncVendorErrorHandling:
-    """Test error handling during sync."""
-
-    def test_sync_vendor_handles_unicode_errors(self, temp_workspace: tuple[Path, Path, Path]) -> None:
-        """Test that unicode errors are caught and reported."""
-        source, target, _ = temp_workspace
-        package = source / "test_pkg"
-        package.mkdir()
-
-        # Create a file with valid Python syntax
-        (package / "test.py").write_text("# Valid Python file\nprint('hello')")
-
-        result = sync_vendor(
-            source_path=source,
-            target_path=target,
-            package="test_pkg",
-            extensions="py",
-        )
-
-        # Should succeed with valid files
-        assert result["status"] == "success"
-        assert result["files_copied"] > 0
-
-    def test_sync_vendor_partial_success(self, temp_workspace: tuple[Path, Path, Path]) -> None:
-        """Test partial success when some files fail but others succeed."""
-        source, target, _ = temp_workspace
-        package = source / "test_pkg"
-        package.mkdir()
-
-        # Create some valid files
-        (package / "valid1.py").write_text("print('valid1')")
-        (package / "valid2.py").write_text("print('valid2')")
-
-        result = sync_vendor(
-            source_path=source,
-            target_path=target,
-            package="test_pkg",
-            extensions="py",
-        )
-
-        assert result["status"] == "success"
-        assert result["files_copied"] >= 2
+        assert f"package directory not found: {_pristine_package.parent / 'nonexistent_package'}" in str(exc_info.value)
 
 
 class TestSyncVendorEdgeCases:
@@ -347,8 +384,8 @@ class TestSyncVendorEdgeCases:
         # Create nested directories with files
         (package / "level1").mkdir()
         (package / "level1" / "level2").mkdir()
-        (package / "level1" / "file1.py").write_text("# level1")
-        (package / "level1" / "level2" / "file2.py").write_text("# level2")
+        _touch(package / "level1" / "file1.py", b"# level1")
+        _touch(package / "level1" / "level2" / "file2.py", b"# level2")
 
         result = sync_vendor(
             source_path=source,
@@ -358,30 +395,9 @@ class TestSyncVendorEdgeCases:
         )
 
         vendor_dir = target / "_vendor" / "struct_pkg"
-        assert (vendor_dir / "level1" / "file1.py").exists()
-        assert (vendor_dir / "level1" / "level2" / "file2.py").exists()
+        assert _collect(vendor_dir) == {"level1/file1.py", "level1/level2/file2.py"}
         assert result["status"] == "success"
 
-    def test_sync_vendor_multiple_extensions(
-        self, temp_workspace: tuple[Path, Path, Path], sample_package: Path
-    ) -> None:
-        """Test filtering multiple extensions."""
-        source, target, _ = temp_workspace
-        package_name = sample_package.name
-
-        result = sync_vendor(
-            source_path=source,
-            target_path=target,
-            package=package_name,
-            extensions="py;json;txt",
-        )
-
-        vendor_dir = target / "_vendor" / package_name
-        assert (vendor_dir / "module1.py").exists()
-        assert (vendor_dir / "config.json").exists()
-        assert (vendor_dir / "data.txt").exists()
-        assert result["files_copied"] >= 4
-
     def test_sync_vendor_case_insensitive_extensions(self, temp_workspace: tuple[Path, Path, Path]) -> None:
         """Test that extension filtering is case-insensitive."""
         source, target, _ = temp_workspace
@@ -389,8 +405,8 @@ class TestSyncVendorEdgeCases:
         package.mkdir()
 
         # Create files with different cases
-        (package / "file.PY").write_text("# uppercase")
-        (package / "config.JSON").write_text("{}")
+        _touch(package / "file.PY", b"# uppercase")
+        _touch(package / "config.JSON", b"{}")
 
         result = sync_vendor(
             source_path=source,
@@ -407,8 +423,8 @@ class TestSyncVendorEdgeCases:
         source, target, _ = temp_workspace
         package = source / "partial_pkg"
         package.mkdir()
-        (package / "file1.py").write_text("# file1")
-        (package / "file2.py").write_text("# file2")
+        _touch(package / "file1.py", b"# file1")
+        _touch(package / "file2.py", b"# file2")
 
         result = sync_vendor(
             source_path=source,
@@ -426,8 +442,8 @@ class TestSyncVendorEdgeCases:
         source, target, _ = temp_workspace
         package = source / "bin_pkg"
         package.mkdir()
-        (package / "module.py").write_text("python")
-        (package / "data.bin").write_bytes(b"\x00\x01\x02")
+        _touch(package / "module.py", b"python")
+        _touch(package / "data.bin", b"\x00\x01\x02")
 
         result = sync_vendor(
             source_path=source,
@@ -439,144 +455,100 @@ class TestSyncVendorEdgeCases:
         assert result["status"] == "success"
         assert result["files_copied"] >= 1  # At least .py file
 
-    def test_sync_vendor_clean_phase_permission_denied(self, temp_workspace: tuple[Path, Path, Path]) -> None:
-        """Test handling of permission denied on clean phase."""
-
-        source, target, _ = temp_workspace
-        package = source / "clean_pkg"
-        package.mkdir()
-        (package / "module.py").write_text("test")
-
-        # First sync to create vendor directory
-        sync_vendor(source, target, "clean_pkg")
-
-        # Mock shutil.rmtree to raise PermissionError
-        with patch("splurge_vendor_sync.sync.shutil.rmtree") as mock_rmtree:
-            mock_rmtree.side_effect = PermissionError("cannot remove")
-
-            with pytest.raises(SplurgeVendorSyncOSError) as exc_info:
-                sync_vendor(source, target, "clean_pkg")
-
-            assert "permission" in str(exc_info.value).lower()
-
-    def test_sync_vendor_clean_phase_os_error(self, temp_workspace: tuple[Path, Path, Path]) -> None:
-        """Test handling of OS errors during clean phase."""
-
-        source, target, _ = temp_workspace
-        package = source / "clean_err_pkg"
-        package.mkdir()
-        (package / "module.py").write_text("test")
-
-        # First sync
-        sync_vendor(source, target, "clean_err_pkg")
-
-        # Mock shutil.rmtree to raise generic OSError
-        with patch("splurge_vendor_sync.sync.shutil.rmtree") as mock_rmtree:
-            mock_rmtree.side_effect = OSError("generic os error")
-
-            with pytest.raises(SplurgeVendorSyncOSError) as exc_info:
-                sync_vendor(source, target, "clean_err_pkg")
-
-            assert "Failed to remove" in str(exc_info.value)
-
-    def test_sync_vendor_safe_io_unicode_error(self, temp_workspace: tuple[Path, Path, Path]) -> None:
-        """Test handling of Unicode errors from safe_io."""
-        from splurge_vendor_sync._vendor.splurge_safe_io.exceptions import (
-            SplurgeSafeIoUnicodeError,
-        )
-
-        source, target, _ = temp_workspace
-        package = source / "unicode_pkg"
-        package.mkdir()
-        (package / "module.py").write_text("# python file")
-
-        with patch("splurge_vendor_sync.sync.open_safe_text_reader") as mock_reader:
-            mock_reader.side_effect = SplurgeSafeIoUnicodeError(message="bad encoding", error_code="encoding-error")
-
-            result = sync_vendor(source, target, "unicode_pkg")
-
-            # Should handle gracefully with error in result
-            assert len(result["errors"]) > 0
-
-    def test_sync_vendor_safe_io_general_error(self, temp_workspace: tuple[Path, Path, Path]) -> None:
-        """Test handling of general Safe IO errors."""
-        from splurge_vendor_sync._vendor.splurge_safe_io.exceptions import (
-            SplurgeSafeIoError,
-        )
-
-        source, target, _ = temp_workspace
-        package = source / "io_err_pkg"
-        package.mkdir()
-        (package / "module.py").write_text("# python")
-
-        with patch("splurge_vendor_sync.sync.open_safe_text_reader") as mock_reader:
-            mock_reader.side_effect = SplurgeSafeIoError(message="io error", error_code="io-error")
-
-            result = sync_vendor(source, target, "io_err_pkg")
-
-            # Should continue with error recorded
-            assert len(result["errors"]) > 0
-
-    def test_sync_vendor_unexpected_exception_during_copy(self, temp_workspace: tuple[Path, Path, Path]) -> None:
-        """Test handling of unexpected exceptions during file copy."""
-        source, target, _ = temp_workspace
-        package = source / "exc_pkg"
-        package.mkdir()
-        (package / "module.py").write_text("# python")
-
-        with patch("splurge_vendor_sync.sync.open_safe_text_reader") as mock_reader:
-            mock_reader.side_effect = RuntimeError("unexpected!")
-
-            result = sync_vendor(source, target, "exc_pkg")
-
-            # Should handle and continue
-            assert len(result["errors"]) > 0
-
-    def test_sync_vendor_permission_denied_mkdir(self, temp_workspace: tuple[Path, Path, Path]) -> None:
-        """Test handling of permission denied when creating directories."""
-
-        source, target, _ = temp_workspace
-        package = source / "mkdir_pkg"
-        package.mkdir()
-        (package / "module.py").write_text("test")
-
-        with patch("splurge_vendor_sync.sync.Path.mkdir") as mock_mkdir:
-            mock_mkdir.side_effect = PermissionError("no access")
-
-            # This should raise as permission error during mkdir propagates
-            with pytest.raises(SplurgeVendorSyncOSError):
-                sync_vendor(source, target, "mkdir_pkg")
-
-    def test_sync_vendor_os_error_during_mkdir(self, temp_workspace: tuple[Path, Path, Path]) -> None:
-        """Test handling of OS errors when creating directories."""
-
-        source, target, _ = temp_workspace
-        package = source / "mkdir_err_pkg"
-        package.mkdir()
-        (package / "module.py").write_text("test")
-
-        with patch("splurge_vendor_sync.sync.Path.mkdir") as mock_mkdir:
-            mock_mkdir.side_effect = OSError("generic error")
-
-            # This should raise as OS error during mkdir propagates
-            with pytest.raises(SplurgeVendorSyncOSError):
-                sync_vendor(source, target, "mkdir_err_pkg")
-
-    def test_sync_vendor_disk_full_during_rglob(self, temp_workspace: tuple[Path, Path, Path]) -> None:
-        """Test handling of disk full errors during sync phase."""
+    @pytest.mark.parametrize(
+        ("patch_target", "side_effect", "primed", "raises", "expected"),
+        [
+            pytest.param(
+                "splurge_vendor_sync.sync.shutil.rmtree",
+                PermissionError("cannot remove"),
+                True,
+                SplurgeVendorSyncOSError,
+                "permission",
+                id="clean_phase_permission_denied",
+            ),
+            pytest.param(
+                "splurge_vendor_sync.sync.shutil.rmtree",
+                OSError("generic os error"),
+                True,
+                SplurgeVendorSyncOSError,
+                "failed to remove",
+                id="clean_phase_os_error",
+            ),
+            pytest.param(
+                "splurge_vendor_sync.sync.Path.mkdir",
+                PermissionError("no access"),
+                False,
+                SplurgeVendorSyncOSError,
+                None,
+                id="permission_denied_mkdir",
+            ),
+            pytest.param(
+                "splurge_vendor_sync.sync.Path.mkdir",
+                OSError("generic error"),
+                False,
+                SplurgeVendorSyncOSError,
+                None,
+                id="os_error_during_mkdir",
+            ),
+            pytest.param(
+                "splurge_vendor_sync.sync.Path.rglob",
+                OSError("No space left on device: disk full"),
+                False,
+                SplurgeVendorSyncOSError,
+                "disk-full",
+                id="disk_full_during_rglob",
+            ),
+            pytest.param(
+                "splurge_vendor_sync.sync.open_safe_text_reader",
+                SplurgeSafeIoUnicodeError(message="bad encoding", error_code="encoding-error"),
+                False,
+                None,
+                None,
+                id="safe_io_unicode_error",
+            ),
+            pytest.param(
+                "splurge_vendor_sync.sync.open_safe_text_reader",
+                SplurgeSafeIoError(message="io error", error_code="io-error"),
+                False,
+                None,
+                None,
+                id="safe_io_general_error",
+            ),
+            pytest.param(
+                "splurge_vendor_sync.sync.open_safe_text_reader",
+                RuntimeError("unexpected!"),
+                False,
+                None,
+                None,
+                id="unexpected_exception_during_copy",
+            ),
+        ],
+    )
+    def test_sync_vendor_error_handling(
+        self,
+        temp_workspace: tuple[Path, Path, Path],
+        patch_target: str,
+        side_effect: BaseException,
+        primed: bool,
+        raises: type[Exception] | None,
+        expected: str | None,
+    ) -> None:
+        """Test that injected failures are raised or recorded as appropriate.
 
+        Failures in the clean phase, directory creation, or the tree walk abort
+        the sync; per-file copy failures are recorded in the result instead.
+        """
         source, target, _ = temp_workspace
-        package = source / "disk_err_pkg"
-        package.mkdir()
-        (package / "module.py").write_text("test")
+        _lay_out_package(source, target, "err_pkg", vendored=primed)
 
-        with patch("splurge_vendor_sync.sync.Path.rglob") as mock_rglob:
-            # Create an OSError that mentions "disk"
-            error = OSError("No space left on device: disk full")
-            mock_rglob.side_effect = error
+        with patch(patch_target, side_effect=side_effect):
+            if raises is None:
+                result = sync_vendor(source, target, "err_pkg")
+                assert len(result["errors"]) > 0
+                return
 
-            with pytest.raises(SplurgeVendorSyncOSError) as exc_info:
-                sync_vendor(source, target, "disk_err_pkg")
+            with pytest.raises(raises) as exc_info:
+                sync_vendor(source, target, "err_pkg")
 
-            # Should match the disk-full code path
-            assert "disk-full" in str(exc_info.value)
+        if expected is not None:
+            assert expected in str(exc_info.value).lower()
@@ -2,100 +2,190 @@
 
 from __future__ import annotations
 
+import os
 import tempfile
-from collections.abc import Generator
+import time
 from pathlib import Path
 
 import pytest
 
 from splurge_vendor_sync.version_scanner import (
+    PackageVersion,
+    clear_version_cache,
     extract_version_from_file,
+    format_nested_version_lines,
     format_nested_version_output,
+    format_version_lines,
     format_version_output,
+    iter_formatted_nested,
     scan_vendor_packages,
     scan_vendor_packages_nested,
 )
 
-
-@pytest.fixture
-def temp_vendor_structure() -> Generator[tuple[Path, Path], None, None]:
-    """Create a temporary vendor directory structure with test packages."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base = Path(tmpdir)
-        target = base / "project"
-        target.mkdir()
-
-        vendor = target / "_vendor"
-        vendor.mkdir()
-
-        # Package 1: splurge_safe_io with __version__ in __init__.py
-        pkg1 = vendor / "splurge_safe_io"
-        pkg1.mkdir()
-        (pkg1 / "__init__.py").write_text('__version__ = "2025.4.3"\n')
-
-        # Package 2: splurge_exceptions with __version__ in __init__.py (double quotes)
-        pkg2 = vendor / "splurge_exceptions"
-        pkg2.mkdir()
-        (pkg2 / "__init__.py").write_text('__version__ = "2025.3.1"\n')
-
-        # Package 3: splurge_zippy with no __version__
-        pkg3 = vendor / "splurge_zippy"
-        pkg3.mkdir()
-        (pkg3 / "__init__.py").write_text("# No version here\n")
-
-        # Package 4: splurge_foo with __version__ in __main__.py (single quotes)
-        pkg4 = vendor / "splurge_foo"
-        pkg4.mkdir()
-        (pkg4 / "__main__.py").write_text("__version__ = '1.0.0'\n")
-
-        # Package 5: splurge_bar with __version__ in __init__.py but also another var
-        pkg5 = vendor / "splurge_bar"
-        pkg5.mkdir()
-        init_content = """
+# __version__ assignment line; fill with the ASCII version bytes
+_VERSION_TMPL = b'__version__ = "%s"\n'
+
+
+def _backdate(path: Path, seconds: int = 60) -> None:
+    """Set path's modification time into the past, outside the scanner's uncached window."""
+    mtime_ns = time.time_ns() - seconds * 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _mkpkg(vendor: Path, name: str, *, init: bytes | None = None, main: bytes | None = None) -> Path:
+    """Create vendor/name, with its parents, and write the given __init__.py/__main__.py contents."""
+    pkg = vendor / name
+    pkg.mkdir(parents=True, exist_ok=True)
+    if init is not None:
+        (pkg / "__init__.py").write_bytes(init)
+    if main is not None:
+        (pkg / "__main__.py").write_bytes(main)
+    return pkg
+
+
+@pytest.fixture(scope="session")
+def temp_vendor_structure(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Path]:
+    """Create a temporary vendor directory structure with test packages.
+
+    Built once per session (per worker under pytest-xdist); tests using it must
+    only read the tree. Their classes share the "version_scanner" xdist group so
+    that `--dist loadgroup` builds it on one worker only.
+    """
+    target = tmp_path_factory.mktemp("scanner") / "project"
+    target.mkdir()
+
+    vendor = target / "_vendor"
+    vendor.mkdir()
+
+    # Package 1: splurge_safe_io with __version__ in __init__.py
+    pkg1 = vendor / "splurge_safe_io"
+    pkg1.mkdir()
+    (pkg1 / "__init__.py").write_bytes(_VERSION_TMPL % b"2025.4.3")
+
+    # Package 2: splurge_exceptions with __version__ in __init__.py (double quotes)
+    pkg2 = vendor / "splurge_exceptions"
+    pkg2.mkdir()
+    (pkg2 / "__init__.py").write_bytes(_VERSION_TMPL % b"2025.3.1")
+
+    # Package 3: splurge_zippy with no __version__
+    pkg3 = vendor / "splurge_zippy"
+    pkg3.mkdir()
+    (pkg3 / "__init__.py").write_bytes(b"# No version here\n")
+
+    # Package 4: splurge_foo with __version__ in __main__.py (single quotes)
+    pkg4 = vendor / "splurge_foo"
+    pkg4.mkdir()
+    (pkg4 / "__main__.py").write_bytes(b"__version__ = '1.0.0'\n")
+
+    # Package 5: splurge_bar with __version__ in __init__.py but also another var
+    pkg5 = vendor / "splurge_bar"
+    pkg5.mkdir()
+    init_content = b"""
 MY_CONSTANT = "not_a_version"
 __version__ = "3.0.0"
 OTHER_VAR = "also_not_a_version"
 """
-        (pkg5 / "__init__.py").write_text(init_content)
-
-        yield target, vendor
+    (pkg5 / "__init__.py").write_bytes(init_content)
+
+    return target, vendor
+
+
+# (content, version_tag, expected) cases for extract_version_from_file
+EXTRACT_CASES = [
+    pytest.param('__version__ = "1.2.3"\n', "__version__", "1.2.3", id="double_quotes"),
+    pytest.param("__version__ = '1.2.3'\n", "__version__", "1.2.3", id="single_quotes"),
+    pytest.param('VERSION = "2.0.0"\n', "VERSION", "2.0.0", id="custom_tag"),
+    pytest.param('VERSIÓN = "2.1.0"\n', "VERSIÓN", "2.1.0", id="non_ascii_tag"),
+    pytest.param("# No version here\nx = 1\n", "__version__", None, id="not_found"),
+    pytest.param(
+        '\nx = "not_version"\n__version__ = "1.5.0"\ny = "also_not_version"\n',
+        "__version__",
+        "1.5.0",
+        id="multiple_assignments",
+    ),
+    pytest.param("__version__ = 123\n", "__version__", None, id="non_string_value"),
+    pytest.param('__version__ = "1.0" + "-dev"\n', "__version__", None, id="concatenation"),
+    pytest.param('__version__ = "1.0" if DEBUG else "2.0"\n', "__version__", None, id="conditional"),
+    pytest.param('__version__ = "1.0"  # release\r\n', "__version__", "1.0", id="trailing_comment_crlf"),
+    pytest.param('__version__ = version = "1.0"\n', "__version__", "1.0", id="chained_assignment"),
+    pytest.param('__version__ = ("1.0")\n', "__version__", "1.0", id="parenthesized"),
+    pytest.param('__version__ = u"1.0"\n', "__version__", "1.0", id="u_prefix"),
+    pytest.param('__version__ = "1.0\'s"\n', "__version__", "1.0's", id="other_quote_in_value"),
+    pytest.param('x = 1\r__version__ = "1.0"\ry = 2\r', "__version__", "1.0", id="cr_line_endings"),
+    pytest.param('__version__ = ""\n__version__ = "1.0"\n', "__version__", "1.0", id="empty_then_real"),
+    pytest.param('__version__ = ""\n', "__version__", None, id="empty_only"),
+    pytest.param('if True:\n    __version__ = f"{1}"\n', "__version__", None, id="f_string"),
+    pytest.param(
+        '"""Example:\n\n    __version__ = "0.0.1"\n"""\n\n__version__ = "1.2.3"\n',
+        "__version__",
+        "1.2.3",
+        id="docstring_example_first",
+    ),
+    pytest.param(
+        'def f():\n    __version__ = "0.0.1"\n\ntry:\n    pass\nexcept ImportError:\n    pass\n__version__ = ("1.2.3")\n',
+        "__version__",
+        "1.2.3",
+        id="function_body_first",
+    ),
+    pytest.param(
+        'try:\n    import x\nexcept ImportError:\n    __version__ = "1.0"\n', "__version__", "1.0", id="nested"
+    ),
+    pytest.param(
+        'if X:\n    pass\nelse:\n    try:\n        pass\n    finally:\n        __version__ = "1.1"\n',
+        "__version__",
+        "1.1",
+        id="nested_orelse_finally",
+    ),
+    pytest.param(
+        'if True:\n    __version__ = "1.0"\nthis is not python\n', "__version__", "1.0", id="indented_invalid_syntax"
+    ),
+    pytest.param("__version__   =   '1.0.0'   \n", "__version__", "1.0.0", id="with_whitespace"),
+    pytest.param('# -*- coding: utf-8 -*-\n__version__ = "1.0.0"\n', "__version__", "1.0.0", id="utf8_encoding"),
+    pytest.param("# padding\n" * 1000 + '__version__ = "4.5.6"\n', "__version__", "4.5.6", id="beyond_prefix"),
+    pytest.param("#" * 4076 + '\n__version__ = "1.0" + "-dev"\n', "__version__", None, id="computed_across_prefix_end"),
+    pytest.param("# padding\n" * 8000 + '__version__ = "4.5.7"\n', "__version__", "4.5.7", id="memory_mapped"),
+]
+
+
+@pytest.fixture(scope="module")
+def extract_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory shared by the extraction cases; each case writes its own file."""
+    return tmp_path_factory.mktemp("extract")
 
 
 class TestExtractVersionFromFile:
     """Test version extraction from individual Python files."""
 
-    def test_extract_version_with_double_quotes(self, tmp_path: Path) -> None:
-        """Test extraction of __version__ with double quotes."""
+    @pytest.mark.parametrize(("content", "version_tag", "expected"), EXTRACT_CASES)
+    def test_extract_version(
+        self,
+        extract_dir: Path,
+        request: pytest.FixtureRequest,
+        content: str,
+        version_tag: str,
+        expected: str | None,
+    ) -> None:
+        """Test extraction across quoting, whitespace, tag and placement variants."""
+        file = extract_dir / f"{request.node.callspec.id}.py"
+        file.write_bytes(content.encode("utf-8"))
+
+        assert extract_version_from_file(file, version_tag=version_tag) == expected
+
+    def test_extract_version_coding_declaration(self, tmp_path: Path) -> None:
+        """Test that a value that is not UTF-8 is decoded per the file's coding declaration."""
         file = tmp_path / "test.py"
-        file.write_text('__version__ = "1.2.3"\n')
+        file.write_bytes(b'# -*- coding: latin-1 -*-\n__version__ = "1.0\xe9"\n')
 
-        version = extract_version_from_file(file)
-        assert version == "1.2.3"
+        assert extract_version_from_file(file) == "1.0\xe9"
 
-    def test_extract_version_with_single_quotes(self, tmp_path: Path) -> None:
-        """Test extraction of __version__ with single quotes."""
+    def test_extract_version_str_path(self, tmp_path: Path) -> None:
+        """Test that a plain string path is accepted."""
         file = tmp_path / "test.py"
-        file.write_text("__version__ = '1.2.3'\n")
+        file.write_bytes(_VERSION_TMPL % b"1.2.3")
 
-        version = extract_version_from_file(file)
+        version = extract_version_from_file(str(file))
         assert version == "1.2.3"
 
-    def test_extract_version_custom_tag(self, tmp_path: Path) -> None:
-        """Test extraction with custom version tag."""
-        file = tmp_path / "test.py"
-        file.write_text('VERSION = "2.0.0"\n')
-
-        version = extract_version_from_file(file, version_tag="VERSION")
-        assert version == "2.0.0"
-
-    def test_extract_version_not_found(self, tmp_path: Path) -> None:
-        """Test when version tag is not found."""
-        file = tmp_path / "test.py"
-        file.write_text("# No version here\nx = 1\n")
-
-        version = extract_version_from_file(file)
-        assert version is None
-
     def test_extract_version_nonexistent_file(self, tmp_path: Path) -> None:
         """Test with nonexistent file."""
         file = tmp_path / "nonexistent.py"
@@ -103,52 +193,100 @@ class TestExtractVersionFromFile:
         version = extract_version_from_file(file)
         assert version is None
 
+    def test_extract_version_adversarial_input(self, tmp_path: Path) -> None:
+        """Test that near-miss lines built to provoke backtracking are rejected promptly."""
+        file = tmp_path / "test.py"
+        near_misses = [
+            b" " * 100_000 + b"__version_",
+            b"__version__" + b" " * 100_000 + b"==",
+            b'__version__ = "' + b"1." * 100_000,
+            b"__version__" * 10_000,
+        ]
+        file.write_bytes(b"\n".join(near_misses * 4) + b'\n__version__ = "9.9.9"\n')
+
+        version = extract_version_from_file(file)
+        assert version == "9.9.9"
+
     def test_extract_version_invalid_syntax(self, tmp_path: Path) -> None:
         """Test with file containing invalid Python syntax."""
         file = tmp_path / "test.py"
-        file.write_text("this is not valid python !!!\n")
+        file.write_bytes(b"this is not valid python !!!\n")
 
         version = extract_version_from_file(file)
         assert version is None
 
-    def test_extract_version_multiple_assignments(self, tmp_path: Path) -> None:
-        """Test extraction when multiple assignments exist."""
-        file = tmp_path / "test.py"
-        content = """
-x = "not_version"
-__version__ = "1.5.0"
-y = "also_not_version"
-"""
-        file.write_text(content)
 
-        version = extract_version_from_file(file)
-        assert version == "1.5.0"
+class TestVersionCache:
+    """Test caching of extracted versions."""
 
-    def test_extract_version_non_string_value(self, tmp_path: Path) -> None:
-        """Test when version is assigned non-string value."""
+    def test_modified_file_is_reread(self, tmp_path: Path) -> None:
+        """Test that a change to the file invalidates its cached version."""
         file = tmp_path / "test.py"
-        file.write_text("__version__ = 123\n")
+        file.write_bytes(_VERSION_TMPL % b"1.0.0")
+        assert extract_version_from_file(file) == "1.0.0"
 
-        version = extract_version_from_file(file)
-        assert version is None
+        file.write_bytes(_VERSION_TMPL % b"1.0.10")
+        assert extract_version_from_file(file) == "1.0.10"
 
-    def test_extract_version_with_whitespace(self, tmp_path: Path) -> None:
-        """Test extraction with various whitespace patterns."""
+    def test_clear_version_cache(self, tmp_path: Path) -> None:
+        """Test that clearing the cache forces a re-read of unchanged metadata."""
         file = tmp_path / "test.py"
-        file.write_text("__version__   =   '1.0.0'   \n")
+        file.write_bytes(_VERSION_TMPL % b"1.0.0")
+        _backdate(file)
+        assert extract_version_from_file(file) == "1.0.0"
 
-        version = extract_version_from_file(file)
-        assert version == "1.0.0"
+        # Same size and modification time: only a cleared cache sees the change
+        stat = file.stat()
+        file.write_bytes(_VERSION_TMPL % b"2.0.0")
+        os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert extract_version_from_file(file) == "1.0.0"
 
-    def test_extract_version_utf8_encoding(self, tmp_path: Path) -> None:
-        """Test extraction with UTF-8 encoded file."""
-        file = tmp_path / "test.py"
-        file.write_text('# -*- coding: utf-8 -*-\n__version__ = "1.0.0"\n', encoding="utf-8")
+        clear_version_cache()
+        assert extract_version_from_file(file) == "2.0.0"
 
-        version = extract_version_from_file(file)
-        assert version == "1.0.0"
+    def test_recently_modified_file_is_not_cached(self, tmp_path: Path) -> None:
+        """Test that a same-size change within one coarse timestamp tick is still seen."""
+        file = tmp_path / "test.py"
+        file.write_bytes(_VERSION_TMPL % b"1.0.0")
+        assert extract_version_from_file(file) == "1.0.0"
+
+        # Same size and modification time, as a 1-2 s timestamp resolution would leave it
+        stat = file.stat()
+        file.write_bytes(_VERSION_TMPL % b"1.0.1")
+        os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert extract_version_from_file(file) == "1.0.1"
+
+    def test_recently_modified_vendor_dir_is_not_cached(self, tmp_path: Path) -> None:
+        """Test that a package added within one coarse timestamp tick is still listed."""
+        vendor = tmp_path / "project" / "_vendor"
+        _mkpkg(vendor, "pkg_a")
+        assert [v.package_name for v in scan_vendor_packages(vendor.parent)] == ["pkg_a"]
+
+        stat = vendor.stat()
+        _mkpkg(vendor, "pkg_b")
+        os.utime(vendor, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert [v.package_name for v in scan_vendor_packages(vendor.parent)] == ["pkg_a", "pkg_b"]
+
+    def test_repeated_scan_sees_package_changes(self, tmp_path: Path) -> None:
+        """Test that cached vendor listings pick up added packages and edited versions."""
+        vendor = tmp_path / "project" / "_vendor"
+        (vendor / "pkg_a").mkdir(parents=True)
+        (vendor / "pkg_a" / "__init__.py").write_bytes(_VERSION_TMPL % b"1.0.0")
+        assert scan_vendor_packages(vendor.parent) == [PackageVersion("pkg_a", "1.0.0")]
+
+        (vendor / "pkg_a" / "__init__.py").write_bytes(_VERSION_TMPL % b"1.0.10")
+        (vendor / "pkg_b").mkdir()
+        # Force a distinct directory mtime on filesystems with coarse timestamps
+        stat = vendor.stat()
+        os.utime(vendor, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert scan_vendor_packages(vendor.parent) == [
+            PackageVersion("pkg_a", "1.0.10"),
+            PackageVersion("pkg_b", None),
+        ]
 
 
+@pytest.mark.xdist_group("version_scanner")
 class TestScanVendorPackages:
     """Test scanning vendor directory for packages."""
 
@@ -189,17 +327,20 @@ class TestScanVendorPackages:
 
         assert package_names == sorted(package_names)
 
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_scan_vendor_packages_max_workers(self, temp_vendor_structure: tuple[Path, Path], max_workers: int) -> None:
+        """Test that serial and threaded scans return the same sorted results."""
+        target, _ = temp_vendor_structure
+
+        versions = scan_vendor_packages(target, max_workers=max_workers)
+
+        assert versions == scan_vendor_packages(target)
+        assert [v["package_name"] for v in versions] == sorted(v["package_name"] for v in versions)
+
     def test_scan_vendor_packages_custom_tag(self, tmp_path: Path) -> None:
         """Test scanning with custom version tag."""
         target = tmp_path / "project"
-        target.mkdir()
-
-        vendor = target / "_vendor"
-        vendor.mkdir()
-
-        pkg = vendor / "test_pkg"
-        pkg.mkdir()
-        (pkg / "__init__.py").write_text('MY_VERSION = "5.0.0"\n')
+        _mkpkg(target / "_vendor", "test_pkg", init=b'MY_VERSION = "5.0.0"\n')
 
         versions = scan_vendor_packages(target, version_tag="MY_VERSION")
         assert len(versions) == 1
@@ -208,14 +349,7 @@ class TestScanVendorPackages:
     def test_scan_vendor_packages_custom_vendor_dir(self, tmp_path: Path) -> None:
         """Test scanning with custom vendor directory."""
         target = tmp_path / "project"
-        target.mkdir()
-
-        vendor = target / "custom_vendor"
-        vendor.mkdir()
-
-        pkg = vendor / "my_pkg"
-        pkg.mkdir()
-        (pkg / "__init__.py").write_text('__version__ = "1.0.0"\n')
+        _mkpkg(target / "custom_vendor", "my_pkg", init=_VERSION_TMPL % b"1.0.0")
 
         versions = scan_vendor_packages(target, vendor_dir="custom_vendor")
         assert len(versions) == 1
@@ -224,20 +358,13 @@ class TestScanVendorPackages:
     def test_scan_vendor_packages_skips_hidden_dirs(self, tmp_path: Path) -> None:
         """Test that hidden directories (starting with _) are skipped."""
         target = tmp_path / "project"
-        target.mkdir()
-
         vendor = target / "_vendor"
-        vendor.mkdir()
 
         # Create a normal package
-        pkg1 = vendor / "normal_pkg"
-        pkg1.mkdir()
-        (pkg1 / "__init__.py").write_text('__version__ = "1.0.0"\n')
+        _mkpkg(vendor, "normal_pkg", init=_VERSION_TMPL % b"1.0.0")
 
         # Create a hidden package (should be skipped)
-        pkg2 = vendor / "_hidden_pkg"
-        pkg2.mkdir()
-        (pkg2 / "__init__.py").write_text('__version__ = "2.0.0"\n')
+        _mkpkg(vendor, "_hidden_pkg", init=_VERSION_TMPL % b"2.0.0")
 
         versions = scan_vendor_packages(target)
         assert len(versions) == 1
@@ -246,15 +373,7 @@ class TestScanVendorPackages:
     def test_scan_vendor_packages_no_init_falls_back_to_main(self, tmp_path: Path) -> None:
         """Test that __main__.py is checked if __init__.py doesn't have version."""
         target = tmp_path / "project"
-        target.mkdir()
-
-        vendor = target / "_vendor"
-        vendor.mkdir()
-
-        pkg = vendor / "fallback_pkg"
-        pkg.mkdir()
-        (pkg / "__init__.py").write_text("# No version\n")
-        (pkg / "__main__.py").write_text('__version__ = "3.5.0"\n')
+        _mkpkg(target / "_vendor", "fallback_pkg", init=b"# No version\n", main=_VERSION_TMPL % b"3.5.0")
 
         versions = scan_vendor_packages(target)
         assert len(versions) == 1
@@ -263,15 +382,7 @@ class TestScanVendorPackages:
     def test_scan_vendor_packages_prefers_init_over_main(self, tmp_path: Path) -> None:
         """Test that __init__.py version takes precedence over __main__.py."""
         target = tmp_path / "project"
-        target.mkdir()
-
-        vendor = target / "_vendor"
-        vendor.mkdir()
-
-        pkg = vendor / "priority_pkg"
-        pkg.mkdir()
-        (pkg / "__init__.py").write_text('__version__ = "1.0.0"\n')
-        (pkg / "__main__.py").write_text('__version__ = "2.0.0"\n')
+        _mkpkg(target / "_vendor", "priority_pkg", init=_VERSION_TMPL % b"1.0.0", main=_VERSION_TMPL % b"2.0.0")
 
         versions = scan_vendor_packages(target)
         assert len(versions) == 1
@@ -295,10 +406,7 @@ class TestScanVendorPackages:
     def test_scan_vendor_packages_empty_vendor(self, tmp_path: Path) -> None:
         """Test scanning empty vendor directory."""
         target = tmp_path / "project"
-        target.mkdir()
-
-        vendor = target / "_vendor"
-        vendor.mkdir()
+        (target / "_vendor").mkdir(parents=True)
 
         versions = scan_vendor_packages(target)
         assert len(versions) == 0
@@ -352,11 +460,36 @@ class TestFormatVersionOutput:
             {"package_name": "banana", "version": None},
         ]
 
-        output = format_version_output(versions)
-        lines = output.split("\n")
-        assert lines[0] == "zebra 1.0.0"
-        assert lines[1] == "apple 2.0.0"
-        assert lines[2] == "banana ?"
+        lines = format_version_lines(versions)
+        assert next(lines) == "zebra 1.0.0"
+        assert next(lines) == "apple 2.0.0"
+        assert next(lines) == "banana ?"
+        assert next(lines, None) is None
+
+    def test_format_version_output_empty_version_matches_nested(self) -> None:
+        """Test that flat and nested formatters apply the same missing-version rule."""
+        versions = [
+            {"package_name": "pkg1", "version": ""},
+            {"package_name": "pkg2", "version": None},
+        ]
+
+        assert format_version_output(versions) == format_nested_version_output(versions)
+
+    def test_format_version_output_package_version_records(self) -> None:
+        """Test formatting PackageVersion records, which also allow dict-style reads."""
+        info = PackageVersion("pkg1", None)
+
+        assert info["package_name"] == "pkg1"
+        assert info.get("version", "unset") is None
+        assert "version" in info
+        for key in ("depth", "__init__", "__class__", "get"):
+            assert key not in info
+            assert info.get(key, "unset") == "unset"
+            with pytest.raises(KeyError):
+                info[key]
+
+        output = format_version_output([PackageVersion("pkg0", "1.0.0"), info])
+        assert output == "pkg0 1.0.0\npkg1 ?"
 
 
 class TestScanVendorPackagesNested:
@@ -373,7 +506,7 @@ class TestScanVendorPackagesNested:
         # Top-level package
         pkg_a = vendor / "library_a"
         pkg_a.mkdir()
-        (pkg_a / "__init__.py").write_text('__version__ = "1.0.0"\n')
+        (pkg_a / "__init__.py").write_bytes(_VERSION_TMPL % b"1.0.0")
 
         versions = scan_vendor_packages_nested(target)
 
@@ -395,14 +528,14 @@ class TestScanVendorPackagesNested:
         # Top-level package with nested vendor
         pkg_a = vendor / "library_a"
         pkg_a.mkdir()
-        (pkg_a / "__init__.py").write_text('__version__ = "1.0.0"\n')
+        (pkg_a / "__init__.py").write_bytes(_VERSION_TMPL % b"1.0.0")
 
         nested_vendor = pkg_a / "_vendor"
         nested_vendor.mkdir()
 
         pkg_b = nested_vendor / "library_b"
         pkg_b.mkdir()
-        (pkg_b / "__init__.py").write_text('__version__ = "2.0.0"\n')
+        (pkg_b / "__init__.py").write_bytes(_VERSION_TMPL % b"2.0.0")
 
         versions = scan_vendor_packages_nested(target)
 
@@ -431,21 +564,21 @@ class TestScanVendorPackagesNested:
         # Level 1
         pkg_a = vendor / "library_a"
         pkg_a.mkdir()
-        (pkg_a / "__init__.py").write_text('__version__ = "1.0.0"\n')
+        (pkg_a / "__init__.py").write_bytes(_VERSION_TMPL % b"1.0.0")
 
         # Level 2
         vendor_b = pkg_a / "_vendor"
         vendor_b.mkdir()
         pkg_b = vendor_b / "library_b"
         pkg_b.mkdir()
-        (pkg_b / "__init__.py").write_text('__version__ = "2.0.0"\n')
+        (pkg_b / "__init__.py").write_bytes(_VERSION_TMPL % b"2.0.0")
 
         # Level 3
         vendor_c = pkg_b / "_vendor"
         vendor_c.mkdir()
         pkg_c = vendor_c / "library_c"
         pkg_c.mkdir()
-        (pkg_c / "__init__.py").write_text('__version__ = "3.0.0"\n')
+        (pkg_c / "__init__.py").write_bytes(_VERSION_TMPL % b"3.0.0")
 
         versions = scan_vendor_packages_nested(target)
 
@@ -476,7 +609,7 @@ class TestScanVendorPackagesNested:
         # Top-level package with nested vendor containing multiple packages
         pkg_a = vendor / "library_a"
         pkg_a.mkdir()
-        (pkg_a / "__init__.py").write_text('__version__ = "1.0.0"\n')
+        (pkg_a / "__init__.py").write_bytes(_VERSION_TMPL % b"1.0.0")
 
         nested_vendor = pkg_a / "_vendor"
         nested_vendor.mkdir()
@@ -485,7 +618,7 @@ class TestScanVendorPackagesNested:
         for name, version in [("library_b", "2.0.0"), ("library_c", "3.0.0")]:
             pkg = nested_vendor / name
             pkg.mkdir()
-            (pkg / "__init__.py").write_text(f'__version__ = "{version}"\n')
+            (pkg / "__init__.py").write_bytes(_VERSION_TMPL % version.encode("ascii"))
 
         versions = scan_vendor_packages_nested(target)
 
@@ -500,39 +633,20 @@ class TestScanVendorPackagesNested:
     def test_scan_nested_complex_hierarchy(self, tmp_path: Path) -> None:
         """Test scanning complex hierarchy with multiple branches."""
         target = tmp_path / "project"
-        target.mkdir()
-
         vendor = target / "_vendor"
-        vendor.mkdir()
 
-        # Top level: library_a, library_d
-        pkg_a = vendor / "library_a"
-        pkg_a.mkdir()
-        (pkg_a / "__init__.py").write_text('__version__ = "1.0.0"\n')
-
-        pkg_d = vendor / "library_d"
-        pkg_d.mkdir()
-        (pkg_d / "__init__.py").write_text('__version__ = "4.0.0"\n')
-
-        # Under library_a: library_b, library_c
-        vendor_a = pkg_a / "_vendor"
-        vendor_a.mkdir()
-
-        pkg_b = vendor_a / "library_b"
-        pkg_b.mkdir()
-        (pkg_b / "__init__.py").write_text('__version__ = "2.0.0"\n')
-
-        pkg_c = vendor_a / "library_c"
-        pkg_c.mkdir()
-        (pkg_c / "__init__.py").write_text('__version__ = "3.0.0"\n')
-
-        # Under library_b: library_e
-        vendor_b = pkg_b / "_vendor"
-        vendor_b.mkdir()
-
-        pkg_e = vendor_b / "library_e"
-        pkg_e.mkdir()
-        (pkg_e / "__init__.py").write_text('__version__ = "5.0.0"\n')
+        # Top level: library_a, library_d; under library_a: library_b, library_c;
+        # under library_b: library_e
+        packages = {
+            vendor / "library_a": "1.0.0",
+            vendor / "library_a" / "_vendor" / "library_b": "2.0.0",
+            vendor / "library_a" / "_vendor" / "library_c": "3.0.0",
+            vendor / "library_d": "4.0.0",
+            vendor / "library_a" / "_vendor" / "library_b" / "_vendor" / "library_e": "5.0.0",
+        }
+        for pkg, version in packages.items():
+            pkg.mkdir(parents=True, exist_ok=True)
+            (pkg / "__init__.py").write_bytes(_VERSION_TMPL % version.encode("ascii"))
 
         versions = scan_vendor_packages_nested(target)
 
@@ -563,14 +677,14 @@ class TestScanVendorPackagesNested:
 
         pkg_a = vendor / "library_a"
         pkg_a.mkdir()
-        (pkg_a / "__init__.py").write_text("# No version\n")
+        (pkg_a / "__init__.py").write_bytes(b"# No version\n")
 
         nested_vendor = pkg_a / "_vendor"
         nested_vendor.mkdir()
 
         pkg_b = nested_vendor / "library_b"
         pkg_b.mkdir()
-        (pkg_b / "__init__.py").write_text('__version__ = "2.0.0"\n')
+        (pkg_b / "__init__.py").write_bytes(_VERSION_TMPL % b"2.0.0")
 
         versions = scan_vendor_packages_nested(target)
 
@@ -580,20 +694,19 @@ class TestScanVendorPackagesNested:
     def test_scan_nested_preserves_depth(self, tmp_path: Path) -> None:
         """Test that depth is correctly tracked through hierarchy."""
         target = tmp_path / "project"
-        target.mkdir()
-
         vendor = target / "_vendor"
-        vendor.mkdir()
 
         # Create 4-level deep nesting
-        current = vendor
-        for level in range(4):
-            pkg = current / f"library_level{level}"
-            pkg.mkdir()
-            (pkg / "__init__.py").write_text(f'__version__ = "{level}.0.0"\n')
-            current = pkg / "_vendor"
-            if level < 3:  # Don't create _vendor for the last level
-                current.mkdir()
+        packages = [
+            vendor / "library_level0",
+            vendor / "library_level0/_vendor/library_level1",
+            vendor / "library_level0/_vendor/library_level1/_vendor/library_level2",
+            vendor / "library_level0/_vendor/library_level1/_vendor/library_level2/_vendor/library_level3",
+        ]
+
+        for level, pkg in enumerate(packages):
+            pkg.mkdir(parents=True, exist_ok=True)
+            (pkg / "__init__.py").write_bytes(_VERSION_TMPL % f"{level}.0.0".encode("ascii"))
 
         versions = scan_vendor_packages_nested(target)
 
@@ -647,8 +760,7 @@ class TestFormatNestedVersionOutput:
             }
         ]
 
-        output = format_nested_version_output(versions)
-        lines = output.split("\n")
+        lines = format_nested_version_lines(versions)
         assert lines[0] == "library_a 1.0.0"
         assert lines[1] == "  library_b 2.0.0"
 
@@ -680,8 +792,7 @@ class TestFormatNestedVersionOutput:
             }
         ]
 
-        output = format_nested_version_output(versions)
-        lines = output.split("\n")
+        lines = format_nested_version_lines(versions)
         assert lines[0] == "library_a 1.0.0"
         assert lines[1] == "  library_b 2.0.0"
         assert lines[2] == "    library_c 3.0.0"
@@ -713,8 +824,7 @@ class TestFormatNestedVersionOutput:
             }
         ]
 
-        output = format_nested_version_output(versions)
-        lines = output.split("\n")
+        lines = format_nested_version_lines(versions)
         assert lines[0] == "library_a 1.0.0"
         assert lines[1] == "  library_b 2.0.0"
         assert lines[2] == "  library_c 3.0.0"
@@ -754,8 +864,7 @@ class TestFormatNestedVersionOutput:
             }
         ]
 
-        output = format_nested_version_output(versions)
-        lines = output.split("\n")
+        lines = format_nested_version_lines(versions)
         assert lines[0] == "library_a 1.0.0"
         assert lines[1] == "  library_b 2.0.0"
         assert lines[2] == "    library_d 4.0.0"
@@ -781,8 +890,7 @@ class TestFormatNestedVersionOutput:
             }
         ]
 
-        output = format_nested_version_output(versions)
-        lines = output.split("\n")
+        lines = format_nested_version_lines(versions)
         assert lines[0] == "library_a ?"
         assert lines[1] == "  library_b 2.0.0"
 
@@ -812,12 +920,12 @@ class TestFormatNestedVersionOutput:
             },
         ]
 
-        output = format_nested_version_output(versions)
-        lines = output.split("\n")
+        lines = format_nested_version_lines(versions)
         assert lines[0] == "library_a 1.0.0"
         assert lines[1] == "library_b 2.0.0"
 
 
+@pytest.mark.xdist_group("version_scanner")
 class TestIntegration:
     """Integration tests for version scanner functionality."""
 
@@ -839,6 +947,36 @@ class TestIntegration:
             assert parts[0]  # package name exists
             assert parts[1]  # version or ? exists
 
+    def test_iter_formatted_nested_matches_formatted_scan(self, tmp_path: Path) -> None:
+        """Test that streamed lines match formatting the materialized nested scan."""
+        target = tmp_path / "project"
+        for rel_path, content in [
+            ("_vendor/library_a/__init__.py", _VERSION_TMPL % b"1.0.0"),
+            ("_vendor/library_a/_vendor/library_b/__init__.py", _VERSION_TMPL % b"2.0.0"),
+            ("_vendor/library_a/_vendor/library_b/_vendor/library_e/__init__.py", b"# no version\n"),
+            ("_vendor/library_a/_vendor/library_c/__main__.py", _VERSION_TMPL % b"3.0.0"),
+            ("_vendor/library_d/__init__.py", _VERSION_TMPL % b"4.0.0"),
+        ]:
+            path = target / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+
+        lines = list(iter_formatted_nested(target))
+
+        assert lines == format_nested_version_lines(scan_vendor_packages_nested(target))
+        assert lines == [
+            "library_a 1.0.0",
+            "  library_b 2.0.0",
+            "    library_e ?",
+            "  library_c 3.0.0",
+            "library_d 4.0.0",
+        ]
+
+    def test_iter_formatted_nested_nonexistent_vendor_dir(self, tmp_path: Path) -> None:
+        """Test that streaming a missing vendor directory raises ValueError."""
+        with pytest.raises(ValueError, match="Vendor directory does not exist"):
+            list(iter_formatted_nested(tmp_path))
+
     def test_scan_with_real_vendored_packages(self) -> None:
         """Test scanning with actual splurge packages if available."""
         # This test would only work if run from the actual project
@@ -854,11 +992,11 @@ class TestIntegration:
             # Create realistic package structures
             pkg1 = vendor / "splurge_safe_io"
             pkg1.mkdir()
-            (pkg1 / "__init__.py").write_text('''"""Module."""\n__version__ = "2025.4.3"\n''')
+            (pkg1 / "__init__.py").write_bytes(b'"""Module."""\n' + _VERSION_TMPL % b"2025.4.3")
 
             pkg2 = vendor / "splurge_exceptions"
             pkg2.mkdir()
-            (pkg2 / "__init__.py").write_text('''"""Module."""\n__version__ = "2025.3.1"\n''')
+            (pkg2 / "__init__.py").write_bytes(b'"""Module."""\n' + _VERSION_TMPL % b"2025.3.1")
 
             versions = scan_vendor_packages(target)
             output = format_version_output(versions)